@@ -0,0 +1,204 @@
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils import automod, database, logger, permissions, spam
+from utils.config import settings
+from utils.decorators import admin_only
+
+KIND_CHOICES = [
+    app_commands.Choice(name="Word or phrase", value="word"),
+    app_commands.Choice(name="Link / domain", value="link"),
+    app_commands.Choice(name="Regular expression", value="regex"),
+]
+ACTION_CHOICES = [
+    app_commands.Choice(name="Delete the message", value="delete"),
+    app_commands.Choice(name="Delete and warn", value="warn"),
+    app_commands.Choice(name="Delete and time out", value="timeout"),
+]
+
+
+class Automod(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.engine = automod.AutomodEngine()
+        self.spam = spam.SpamDetector()
+
+    async def cog_load(self):
+        self.engine.load(await database.get_automod_rules())
+        print(f"✅ Loaded {len(self.engine)} automod rule(s).")
+
+    def is_exempt(self, message: discord.Message) -> bool:
+        return (
+            message.guild is None
+            or message.author.bot
+            or not isinstance(message.author, discord.Member)
+            or permissions.resolver.has_tier(message.author, permissions.Tier.MODERATOR)
+        )
+
+    async def warn(self, member: discord.Member, reason: str):
+        """Warns through the Moderation cog, so escalation rules see automod warnings too."""
+        moderation = self.bot.get_cog("Moderation")
+        if moderation is not None:
+            note = await moderation.issue_warning(member, self.bot.user.id, reason)
+            if note:
+                print(f"Automod warning for {member.id}: {note.strip()}")
+        else:
+            await database.add_warning(member.guild.id, member.id, self.bot.user.id, reason)
+
+    async def enforce(self, message: discord.Message, rule: automod.AutomodRule):
+        """Deletes the offending message and applies the rule's action to its author."""
+        member = message.author
+        reason = f"Automod rule {rule.describe()}"
+        try:
+            await message.delete()
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as e:
+            print(f"Automod could not delete message {message.id}: {e}")
+
+        try:
+            if rule.action == "warn":
+                await self.warn(member, reason)
+            elif rule.action == "timeout":
+                await member.timeout(
+                    timedelta(minutes=settings.AUTOMOD_TIMEOUT_MINUTES), reason=reason
+                )
+        except discord.HTTPException as e:
+            print(f"Automod could not apply '{rule.action}' to {member.id}: {e}")
+        logger.log_action(
+            str(self.bot.user.id), f"automod-{rule.action}", str(member.id), reason
+        )
+
+    async def punish_spam(self, message: discord.Message, verdict: spam.SpamVerdict):
+        """Deletes every message involved, then times out and warns the author."""
+        member = message.author
+        reason = f"Spam: {verdict.describe()}"
+        self.spam.reset(message.guild.id, member.id)
+
+        by_channel = defaultdict(list)
+        for channel_id, message_id in verdict.messages:
+            by_channel[channel_id].append(discord.Object(id=message_id))
+        for channel_id, messages in by_channel.items():
+            channel = message.guild.get_channel_or_thread(channel_id)
+            if channel is None:
+                continue
+            try:
+                await channel.delete_messages(messages, reason=reason)
+            except discord.HTTPException as e:
+                print(f"Could not delete spam in channel {channel_id}: {e}")
+
+        try:
+            await member.timeout(
+                timedelta(minutes=settings.AUTOMOD_TIMEOUT_MINUTES), reason=reason
+            )
+        except discord.HTTPException as e:
+            print(f"Could not time out spammer {member.id}: {e}")
+        await self.warn(member, reason)
+        logger.log_action(str(self.bot.user.id), "spam", str(member.id), reason)
+
+    # --- MESSAGE LISTENERS ---
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if self.is_exempt(message):
+            return
+        if message.content:
+            rule = self.engine.check(message.guild.id, message.content)
+            if rule:
+                return await self.enforce(message, rule)
+
+        verdict = self.spam.record(
+            message.guild.id,
+            message.author.id,
+            message.channel.id,
+            message.id,
+            message.content,
+            time.time(),
+        )
+        if verdict:
+            await self.punish_spam(message, verdict)
+
+    @commands.Cog.listener()
+    async def on_message_edit(self, before: discord.Message, after: discord.Message):
+        # Edits are filtered again, but do not count towards spam.
+        if before.content == after.content or not after.content:
+            return
+        if self.is_exempt(after):
+            return
+        rule = self.engine.check(after.guild.id, after.content)
+        if rule:
+            await self.enforce(after, rule)
+
+    # --- RULE MANAGEMENT COMMANDS ---
+    @app_commands.command(name="addfilter", description="Adds an automod filter rule.")
+    @app_commands.describe(
+        kind="What the pattern is matched as",
+        pattern="The word, domain or regular expression to filter",
+        action="What happens to messages that match",
+    )
+    @app_commands.choices(kind=KIND_CHOICES, action=ACTION_CHOICES)
+    @admin_only()
+    async def addfilter(
+        self,
+        interaction: discord.Interaction,
+        kind: app_commands.Choice[str],
+        pattern: str,
+        action: app_commands.Choice[str],
+    ):
+        try:
+            pattern = automod.normalize_pattern(kind.value, pattern)
+        except ValueError as e:
+            return await interaction.response.send_message(f"❌ {e}.", ephemeral=True)
+
+        rule_id = await database.add_automod_rule(
+            interaction.guild.id, kind.value, pattern, action.value, interaction.user.id
+        )
+        if rule_id is None:
+            return await interaction.response.send_message(
+                "❌ The rule could not be saved.", ephemeral=True
+            )
+        rule = automod.AutomodRule(rule_id, kind.value, pattern, action.value)
+        self.engine.add(interaction.guild.id, rule)
+        logger.log_action(
+            str(interaction.user.id), "automod-add", f"rule:{rule_id}", rule.describe()
+        )
+        await interaction.response.send_message(
+            f"✅ Added automod rule {rule.describe()}.", ephemeral=True
+        )
+
+    @app_commands.command(
+        name="removefilter", description="Removes an automod filter rule."
+    )
+    @app_commands.describe(rule_id="The ID shown by /filters")
+    @admin_only()
+    async def removefilter(self, interaction: discord.Interaction, rule_id: int):
+        if not await database.remove_automod_rule(interaction.guild.id, rule_id):
+            return await interaction.response.send_message(
+                f"❌ There is no automod rule #{rule_id}.", ephemeral=True
+            )
+        self.engine.remove(interaction.guild.id, rule_id)
+        logger.log_action(
+            str(interaction.user.id), "automod-remove", f"rule:{rule_id}", "Rule removed."
+        )
+        await interaction.response.send_message(
+            f"✅ Removed automod rule #{rule_id}.", ephemeral=True
+        )
+
+    @app_commands.command(name="filters", description="Lists the automod filter rules.")
+    @admin_only()
+    async def filters(self, interaction: discord.Interaction):
+        rules = self.engine.rules(interaction.guild.id)
+        embed = discord.Embed(title="Automod Rules", color=discord.Color.dark_red())
+        if rules:
+            embed.description = "\n".join(rule.describe() for rule in rules)[:4000]
+        else:
+            embed.description = "No automod rules are set up."
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot):
+    await bot.add_cog(Automod(bot))
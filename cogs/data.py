@@ -0,0 +1,122 @@
+import asyncio
+import gzip
+import os
+import shutil
+import tempfile
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils import database, logger, response_utils, transfer
+from utils.decorators import admin_only
+
+
+def gzip_file(path: str) -> str:
+    """Compresses `path` next to itself and returns the new `.gz` path."""
+    gz_path = path + ".gz"
+    with open(path, "rb") as src, gzip.open(gz_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    return gz_path
+
+
+class Data(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    # --- EXPORT COMMAND ---
+    @app_commands.command(
+        name="exportwarnings", description="Exports this server's warnings as a file."
+    )
+    @app_commands.describe(file_format="The file format of the export.")
+    @app_commands.rename(file_format="format")
+    @app_commands.choices(
+        file_format=[
+            app_commands.Choice(name="JSON Lines", value="jsonl"),
+            app_commands.Choice(name="CSV", value="csv"),
+        ]
+    )
+    @admin_only()
+    async def exportwarnings(
+        self,
+        interaction: discord.Interaction,
+        file_format: app_commands.Choice[str],
+    ):
+        await response_utils.defer(interaction)
+        await database.flush_warnings()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(
+                tmp, f"warnings-{interaction.guild.id}.{file_format.value}"
+            )
+            # The export streams rows in chunks on a worker thread, never on the loop.
+            count = await asyncio.to_thread(
+                transfer.export_warnings, database.DB_PATH, path, interaction.guild.id
+            )
+            if os.path.getsize(path) > interaction.guild.filesize_limit:
+                path = await asyncio.to_thread(gzip_file, path)
+            if os.path.getsize(path) > interaction.guild.filesize_limit:
+                return await interaction.edit_original_response(
+                    content=f"❌ The export of {count} warnings is too large to upload. "
+                    "Please use `python -m utils.transfer export` on the host instead."
+                )
+
+            logger.log_action(
+                str(interaction.user.id),
+                "exportwarnings",
+                f"guild:{interaction.guild.id}",
+                f"Exported {count} warnings as {file_format.value}.",
+            )
+            await interaction.followup.send(
+                content=f"✅ Exported **{count}** warnings.",
+                file=discord.File(path),
+                ephemeral=True,
+            )
+
+    # --- IMPORT COMMAND ---
+    @app_commands.command(
+        name="importwarnings",
+        description="Imports warnings from a JSONL or CSV export, skipping duplicates.",
+    )
+    @app_commands.describe(file="A .jsonl or .csv file (optionally .gz) from /exportwarnings.")
+    @admin_only()
+    async def importwarnings(
+        self, interaction: discord.Interaction, file: discord.Attachment
+    ):
+        await response_utils.defer(interaction)
+        try:
+            transfer.detect_format(file.filename)
+        except ValueError as e:
+            return await interaction.edit_original_response(content=f"❌ {e}")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, os.path.basename(file.filename))
+            await file.save(path)
+            try:
+                imported, skipped = await asyncio.to_thread(
+                    transfer.import_warnings,
+                    database.DB_PATH,
+                    path,
+                    interaction.guild.id,
+                )
+            except (ValueError, UnicodeDecodeError, OSError) as e:
+                return await interaction.edit_original_response(
+                    content=f"❌ Could not read the file: {e}"
+                )
+            finally:
+                # Batches committed before an error are already in the table.
+                database.invalidate_counts()
+
+        logger.log_action(
+            str(interaction.user.id),
+            "importwarnings",
+            f"guild:{interaction.guild.id}",
+            f"Imported {imported} warnings, skipped {skipped}.",
+        )
+        await interaction.edit_original_response(
+            content=f"✅ Imported **{imported}** warnings, skipped **{skipped}** duplicate or invalid rows."
+        )
+
+
+async def setup(bot):
+    await bot.add_cog(Data(bot))
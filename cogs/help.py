@@ -2,97 +2,166 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from utils.permissions import Tier, command_tier
 
-def is_admin_command(command: app_commands.Command) -> bool:
-    for check in command.checks:
-        if "is_admin" in check.__qualname__:
-            return True
-    return False
+TIER_MARKERS = {Tier.MODERATOR: " 🛡️", Tier.ADMIN: " 🔒"}
 
 
-# --- The Dropdown View ---
-class HelpView(discord.ui.View):
+# --- The Help Catalog ---
+class HelpCatalog:
+    """
+    Every category's help embed, rendered once and reused until a cog is
+    added or removed (the bot dispatches `cogs_changed` when that happens).
+    """
+
     def __init__(self, bot: commands.Bot):
-        super().__init__(timeout=180)
         self.bot = bot
-        self.add_item(self.create_dropdown())
+        self.options = []
+        self.embeds = {}
+        self.stale = True
+        # Views whose dropdown lists the categories; updated on every rebuild.
+        self.views = []
+
+    def invalidate(self):
+        self.stale = True
 
-    def create_dropdown(self) -> discord.ui.Select:
-        options = [
+    def build(self):
+        self.options = [
             discord.SelectOption(
                 label=cog_name, description=f"Commands from the {cog_name} category."
             )
             for cog_name in self.bot.cogs
             if cog_name != "Help"
         ]
+        self.embeds = {
+            cog_name: create_help_embed(cog)
+            for cog_name, cog in self.bot.cogs.items()
+            if cog_name != "Help"
+        }
+        for view in self.views:
+            view.select.options = self.options
+        self.stale = False
+
+    def refresh(self):
+        """Rebuilds the catalog if a cog was added or removed since the last build."""
+        if self.stale:
+            self.build()
+
+
+def create_help_embed(cog: commands.Cog) -> discord.Embed:
+    embed = discord.Embed(
+        title=f"Help: {cog.qualified_name} Commands", color=discord.Color.blue()
+    )
+
+    # Groups such as /faq are listed as their subcommands.
+    commands_list = []
+    for command in cog.get_app_commands():
+        if isinstance(command, app_commands.Group):
+            commands_list.extend(
+                c for c in command.walk_commands() if isinstance(c, app_commands.Command)
+            )
+        else:
+            commands_list.append(command)
+    if not commands_list:
+        embed.description = "No commands found in this category."
+    else:
+        for command in sorted(commands_list, key=lambda c: c.qualified_name):
+
+            params = " ".join([f"<{p.name}>" for p in command.parameters])
+            marker = TIER_MARKERS.get(command_tier(command), "")
+
+            embed.add_field(
+                name=f"`/{command.qualified_name} {params}`{marker}",
+                value=f"_{command.description}_",
+                inline=False,
+            )
+
+    tiers = {command_tier(command) for command in commands_list}
+    if Tier.ADMIN in tiers and Tier.MODERATOR in tiers:
+        embed.set_footer(text="🔒 Admin-only  •  🛡️ Moderators and admins")
+    elif Tier.ADMIN in tiers:
+        embed.set_footer(text="🔒 This command is admin-only.")
+    elif Tier.MODERATOR in tiers:
+        embed.set_footer(text="🛡️ This command is for moderators and admins.")
+
+    return embed
 
-        select = discord.ui.Select(
+
+# --- The Dropdown View ---
+class HelpView(discord.ui.View):
+    """
+    The category dropdown. One instance is registered with `bot.add_view` and
+    answers the dropdown on every help menu, however old; it never times out.
+    """
+
+    def __init__(self, catalog: HelpCatalog):
+        super().__init__(timeout=None)
+        self.catalog = catalog
+        self.select = discord.ui.Select(
             placeholder="Select a category to see its commands...",
-            options=options,
+            options=catalog.options or [discord.SelectOption(label="Help")],
             custom_id="help_dropdown",
         )
-        select.callback = self.dropdown_callback
-        return select
+        self.select.callback = self.dropdown_callback
+        self.add_item(self.select)
 
     async def dropdown_callback(self, interaction: discord.Interaction):
-        cog_name = interaction.data["values"][0]
-        cog = self.bot.get_cog(cog_name)
+        self.catalog.refresh()
+        embed = self.catalog.embeds.get(interaction.data["values"][0])
 
-        if not cog:
+        if not embed:
             await interaction.response.send_message(
                 "This category could not be found.", ephemeral=True
             )
             return
 
-        embed = self.create_help_embed(cog)
-
         await interaction.response.edit_message(embed=embed)
 
-    def create_help_embed(self, cog: commands.Cog) -> discord.Embed:
-        embed = discord.Embed(
-            title=f"Help: {cog.qualified_name} Commands", color=discord.Color.blue()
-        )
-
-        commands_list = cog.get_app_commands()
-        if not commands_list:
-            embed.description = "No commands found in this category."
-        else:
-            for command in sorted(commands_list, key=lambda c: c.name):
-
-                params = " ".join([f"<{p.name}>" for p in command.parameters])
-                admin_marker = " 🔒" if is_admin_command(command) else ""
-
-                embed.add_field(
-                    name=f"`/{command.name} {params}`{admin_marker}",
-                    value=f"_{command.description}_",
-                    inline=False,
-                )
-
-        if "🔒" in embed.fields[0].name:
-            embed.set_footer(text="🔒 This command is admin-only.")
-
-        return embed
-
 
 # --- The Help Cog ---
 class Help(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.catalog = HelpCatalog(bot)
+        self.menu_embed = None
+
+    async def cog_load(self):
+        self.view = HelpView(self.catalog)
+        self.bot.add_view(self.view)
+        # What /help sends. It is stopped, so sending it never registers another
+        # listener: every message's dropdown is answered by `self.view`. (A live
+        # view sent ephemerally would also get a 15-minute timeout forced on it.)
+        self.template = HelpView(self.catalog)
+        self.template.stop()
+        self.catalog.views = [self.view, self.template]
+
+    async def cog_unload(self):
+        self.view.stop()
+
+    @commands.Cog.listener()
+    async def on_cogs_changed(self):
+        self.catalog.invalidate()
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self.catalog.refresh()
 
     @app_commands.command(
         name="help", description="Shows a list of all available commands."
     )
     async def help(self, interaction: discord.Interaction):
-        embed = discord.Embed(
-            title="Help Menu",
-            description="Welcome to the help menu! Please select a category from the dropdown below to see the available commands.",
-            color=discord.Color.green(),
-        )
-        embed.set_thumbnail(url=self.bot.user.display_avatar.url)
-        embed.set_footer(text="This menu will become inactive after 3 minutes.")
+        self.catalog.refresh()
+        if self.menu_embed is None:
+            self.menu_embed = discord.Embed(
+                title="Help Menu",
+                description="Welcome to the help menu! Please select a category from the dropdown below to see the available commands.",
+                color=discord.Color.green(),
+            )
+            self.menu_embed.set_thumbnail(url=self.bot.user.display_avatar.url)
 
-        view = HelpView(self.bot)
-        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        await interaction.response.send_message(
+            embed=self.menu_embed, view=self.template, ephemeral=True
+        )
 
 
 async def setup(bot):
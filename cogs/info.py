@@ -1,46 +1,243 @@
+import asyncio
 import json
+import os
+from typing import NamedTuple
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
+
+from utils import response_utils, search
+from utils.faq_store import AnswerStore
+from utils.config import settings
+from utils.decorators import admin_only
+
+FAQ_PATH = "faq.json"
+RESULTS_PAGE_SIZE = 5
+ANSWER_PREVIEW_LENGTH = 200
 
 
 # --- FAQ Loading ---
-def load_faqs():
+class FaqSnapshot(NamedTuple):
+    """
+    Everything built from one version of faq.json, swapped in as a whole.
+    Only the questions are held in memory; answers are read from `answers`.
+    """
+
+    questions: list
+    answers: AnswerStore
+    index: search.FaqIndex
+    text_index: search.FullTextIndex
+    stamp: tuple  # (mtime_ns, size) of the file it was built from
+
+
+def file_stamp(path: str) -> tuple | None:
     try:
-        with open("faq.json", "r", encoding="utf-8") as f:
-            return json.load(f)
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def build_snapshot(path: str = FAQ_PATH) -> FaqSnapshot:
+    """
+    Parses faq.json and builds its lookup structures. Raises OSError or
+    ValueError (including json.JSONDecodeError) if the file is missing or
+    malformed, so a bad file never produces a half-built snapshot.
+    """
+    stamp = file_stamp(path)
+    with open(path, "r", encoding="utf-8") as f:
+        faqs = json.load(f)
+    if not isinstance(faqs, list):
+        raise ValueError("expected a list of question/answer entries")
+    for n, item in enumerate(faqs):
+        if not (
+            isinstance(item, dict)
+            and isinstance(item.get("question"), str)
+            and isinstance(item.get("answer"), str)
+        ):
+            raise ValueError(f"entry {n} needs a 'question' and an 'answer' string")
+
+    questions = [item["question"] for item in faqs]
+    answers = AnswerStore(
+        (item["answer"] for item in faqs), settings.FAQ_ANSWER_CACHE_SIZE
+    )
+    index = search.FaqIndex(questions)
+    text_index = search.FullTextIndex(
+        [(item["question"], item["answer"]) for item in faqs]
+    )
+    # `faqs` is dropped on return, taking the full answer strings with it.
+    return FaqSnapshot(questions, answers, index, text_index, stamp)
+
+
+def empty_snapshot() -> FaqSnapshot:
+    return FaqSnapshot(
+        [],
+        AnswerStore([]),
+        search.FaqIndex([]),
+        search.FullTextIndex([]),
+        file_stamp(FAQ_PATH),
+    )
+
+
+def load_faqs() -> FaqSnapshot:
+    try:
+        return build_snapshot()
     except FileNotFoundError:
         print("⚠️ WARNING: faq.json not found. The Info cog will not have questions.")
-        return []
-    except json.JSONDecodeError:
+    except (OSError, ValueError) as e:
         print(
-            "⚠️ WARNING: faq.json is not formatted correctly. The Info cog will not have questions."
+            f"⚠️ WARNING: faq.json is not formatted correctly ({e}). The Info cog will not have questions."
         )
-        return []
+    return empty_snapshot()
+
+
+def create_results_embed(
+    terms: str, snapshot: FaqSnapshot, results: list, page: int
+) -> discord.Embed:
+    """Builds one page of `/faq search` results from `FullTextIndex.search` pairs."""
+    pages = max(1, -(-len(results) // RESULTS_PAGE_SIZE))
+    embed = discord.Embed(
+        title=f"🔎 FAQ results for \"{terms[:200]}\"",
+        color=discord.Color.blue(),
+    )
+    if not results:
+        embed.description = "No questions or answers mention those words."
+        return embed
+
+    offset = page * RESULTS_PAGE_SIZE
+    page_results = results[offset : offset + RESULTS_PAGE_SIZE]
+    for i, (entry, _) in enumerate(page_results, start=offset + 1):
+        answer = snapshot.answers.get(entry)
+        if len(answer) > ANSWER_PREVIEW_LENGTH:
+            answer = answer[: ANSWER_PREVIEW_LENGTH - 1].rstrip() + "…"
+        embed.add_field(
+            name=f"{i}. {snapshot.questions[entry]}"[:256],
+            value=answer or "\u200b",
+            inline=False,
+        )
+    embed.set_footer(
+        text=f"Page {page + 1}/{pages} • {len(results)} result(s) • Use /info for a full answer"
+    )
+    return embed
+
+
+# --- The Search Results Pagination View ---
+class SearchResultsView(discord.ui.View):
+    """Pages through `/faq search` results, which are ranked once up front."""
+
+    def __init__(self, terms: str, snapshot: FaqSnapshot, results: list):
+        super().__init__(timeout=180)
+        self.terms = terms
+        self.snapshot = snapshot
+        self.results = results
+        self.page = 0
+        self.pages = max(1, -(-len(results) // RESULTS_PAGE_SIZE))
+
+    def render(self) -> discord.Embed:
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.pages - 1
+        return create_results_embed(self.terms, self.snapshot, self.results, self.page)
+
+    @discord.ui.button(label="Previous", emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def previous_page(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        self.page = max(0, self.page - 1)
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+    @discord.ui.button(label="Next", emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(self.pages - 1, self.page + 1)
+        await interaction.response.edit_message(embed=self.render(), view=self)
 
 
 # The Info cog, providing information via a slash command.
 class Info(commands.Cog):
+    faq = app_commands.Group(name="faq", description="Search and manage the FAQ behind /info.")
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.faqs = load_faqs()
-        self.faq_questions = [item["question"] for item in self.faqs]
-        self.faq_lookup = {
-            item["question"].lower(): item["answer"] for item in self.faqs
-        }
-        print(f"✅ Loaded {len(self.faq_lookup)} info entries.")
+        # Handlers read `self.snapshot` once and use only that, so a reload
+        # replacing it midway never mixes two versions of the FAQ. It stays
+        # empty until `cog_load` has built the first one.
+        self.snapshot = empty_snapshot()
+        self.reload_lock = asyncio.Lock()
+        # Stamp of the last file that failed to load, so it is reported only once.
+        self.failed_stamp = None
+
+    async def cog_load(self):
+        # Built in a worker thread, so a large faq.json does not block the event loop.
+        self.snapshot = await asyncio.to_thread(load_faqs)
+        print(f"✅ Loaded {len(self.snapshot.questions)} info entries.")
+        if settings.FAQ_WATCH_SECONDS > 0:
+            self.faq_watch.change_interval(seconds=settings.FAQ_WATCH_SECONDS)
+            self.faq_watch.start()
+
+    async def cog_unload(self):
+        self.faq_watch.cancel()
+
+    async def reload_faqs(self) -> str | None:
+        """Rebuilds the FAQ in a worker thread and swaps it in. Returns an error, if any."""
+        async with self.reload_lock:
+            try:
+                snapshot = await asyncio.to_thread(build_snapshot)
+            except (OSError, ValueError) as e:
+                self.failed_stamp = file_stamp(FAQ_PATH)
+                print(f"⚠️ faq.json was not reloaded, keeping the current FAQ: {e}")
+                return str(e)
+            self.snapshot = snapshot
+            self.failed_stamp = None
+            print(f"✅ Reloaded {len(snapshot.questions)} info entries.")
+            return None
+
+    # --- FILE WATCHER ---
+    @tasks.loop(seconds=30)
+    async def faq_watch(self):
+        stamp = file_stamp(FAQ_PATH)
+        if stamp is None or stamp in (self.snapshot.stamp, self.failed_stamp):
+            return
+        await self.reload_faqs()
+
+    @faq.command(name="reload", description="Reload faq.json without restarting the bot.")
+    @admin_only()
+    async def reload(self, interaction: discord.Interaction):
+        await response_utils.defer(interaction)
+        error = await self.reload_faqs()
+        if error:
+            await interaction.followup.send(
+                f"❌ faq.json could not be loaded, the current FAQ was kept.\n`{error}`",
+                ephemeral=True,
+            )
+        else:
+            await interaction.followup.send(
+                f"✅ Reloaded {len(self.snapshot.questions)} FAQ entries.", ephemeral=True
+            )
+
+    @faq.command(name="search", description="Search every FAQ question and answer.")
+    @app_commands.describe(terms="Words to look for, e.g. 'reset password'")
+    async def faq_search(self, interaction: discord.Interaction, terms: str):
+        snapshot = self.snapshot
+        results = snapshot.text_index.search(terms)
+        view = SearchResultsView(terms, snapshot, results)
+        embed = view.render()
+        if view.pages == 1:
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        else:
+            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
 
     async def question_autocomplete(
         self,
         interaction: discord.Interaction,
         current: str,
     ) -> list[app_commands.Choice[str]]:
+        snapshot = self.snapshot
         return [
             app_commands.Choice(name=question, value=question)
-            for question in self.faq_questions
-            if current.lower() in question.lower()
-        ][:25]
+            for question in map(
+                snapshot.questions.__getitem__, snapshot.index.search(current)
+            )
+        ]
 
     @app_commands.command(
         name="info", description="Get information about frequently asked questions."
@@ -48,7 +245,9 @@ class Info(commands.Cog):
     @app_commands.autocomplete(question=question_autocomplete)
     @app_commands.describe(question="Select a question from the list to get an answer.")
     async def info(self, interaction: discord.Interaction, question: str):
-        answer_text = self.faq_lookup.get(question.lower())
+        snapshot = self.snapshot
+        entry = snapshot.index.find(question)
+        answer_text = snapshot.answers.get(entry) if entry is not None else None
 
         if answer_text:
             embed = discord.Embed(
@@ -1,10 +1,8 @@
-import asyncio
-
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from utils import logger
+from utils import cleanup, logger, response_utils
 
 # Import utils directly
 from utils.decorators import admin_only
@@ -62,7 +60,7 @@ class Messaging(commands.Cog):
         title: str,
         description: str,
     ):
-        await interaction.response.defer(ephemeral=True)
+        await response_utils.defer(interaction)
 
         processed_description = description.replace("\\n", "\n")
         embed_color = parse_color(color) if color else discord.Color.blue()
@@ -81,8 +79,7 @@ class Messaging(commands.Cog):
         await interaction.edit_original_response(
             content="✅ Your custom announcement has been posted."
         )
-        await asyncio.sleep(5)
-        await interaction.delete_original_response()
+        cleanup.delete_later(interaction)
 
     # --- SAY COMMAND (Now in the same cog) ---
     @app_commands.command(
@@ -91,7 +88,7 @@ class Messaging(commands.Cog):
     @app_commands.describe(message="The message to say. Use '\\n' for a new line.")
     @admin_only()
     async def say(self, interaction: discord.Interaction, message: str):
-        await interaction.response.defer(ephemeral=True)
+        await response_utils.defer(interaction)
 
         processed_message = message.replace("\\n", "\n")
 
@@ -112,8 +109,7 @@ class Messaging(commands.Cog):
         await interaction.edit_original_response(
             content="✅ Your message has been sent anonymously and logged."
         )
-        await asyncio.sleep(5)
-        await interaction.delete_original_response()
+        cleanup.delete_later(interaction)
 
 
 async def setup(bot):
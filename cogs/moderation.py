@@ -1,24 +1,361 @@
 import asyncio
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 import discord
 from discord import Member, app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 
-from utils import checks, database, logger
+from utils import (
+    checks,
+    cleanup,
+    database,
+    escalation,
+    logger,
+    response_utils,
+    send_queue,
+)
+from utils.config import settings
 from utils.decorators import admin_only
+from utils.scheduler import HeapScheduler
+
+
+WARNINGS_PAGE_SIZE = 10
+MODLOG_LIMIT = 25
+
+# --- Mass action limits ---
+MAX_MASS_TARGETS = 1000
+BULK_BAN_CHUNK = 200  # Discord's bulk-ban endpoint accepts at most 200 users per call
+MASS_KICK_CONCURRENCY = 5
+MASS_BAN_CONCURRENCY = 5  # single bans at a time when the bulk endpoint is refused
+PROGRESS_INTERVAL = 2.0  # seconds between progress edits
+
+# --- Expiring punishments ---
+UNBAN_JOB = "unban"
+JOB_RETRY_DELAY = 300  # seconds before retrying an expiry Discord rejected
+
+
+def create_warnings_embed(
+    member: Member, total: int, rows: list, page: int
+) -> discord.Embed:
+    """Builds one page of a member's warning history from `get_warnings_page` rows."""
+    embed = discord.Embed(
+        title=f"Warning History for {member.display_name}",
+        description=f"**Total Warnings: {total}**",
+        color=discord.Color.orange(),
+    )
+    if total == 0:
+        embed.description += "\n\nThis user has a clean record."
+        return embed
+
+    offset = page * WARNINGS_PAGE_SIZE
+    for i, (_, moderator_id, reason, timestamp) in enumerate(rows, start=offset + 1):
+        try:
+            moderator = member.guild.get_member(moderator_id)
+            mod_display = moderator.display_name if moderator else "Unknown Moderator"
+            naive_dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+            aware_dt = naive_dt.replace(tzinfo=timezone.utc)
+            timestamp_str = f"<t:{int(aware_dt.timestamp())}:R>"
+            embed.add_field(
+                name=f"Warning #{i} (by {mod_display})",
+                value=f"**Reason:** `{reason}`\n**When:** {timestamp_str}",
+                inline=False,
+            )
+        except Exception as e:
+            print(f"Could not parse warning #{i} for user {member.id}: {e}")
+            continue
+
+    pages = max(1, -(-total // WARNINGS_PAGE_SIZE))
+    embed.set_footer(text=f"Page {page + 1} of {pages}")
+    return embed
+
+
+class ProgressReporter:
+    """Edits the deferred response with progress, at most once per interval."""
+
+    def __init__(self, interaction: discord.Interaction, verb: str, total: int):
+        self.interaction = interaction
+        self.verb = verb
+        self.total = total
+        self.last_update = 0.0
+
+    async def update(self, done: int, failed: int = 0):
+        now = time.monotonic()
+        if now - self.last_update < PROGRESS_INTERVAL:
+            return
+        self.last_update = now
+        await self.interaction.edit_original_response(
+            content=f"⏳ {self.verb} {done}/{self.total} (failed: {failed})..."
+        )
+
+
+def collect_mass_targets(
+    interaction: discord.Interaction,
+    users: str | None,
+    joined_minutes: int | None,
+    members_only: bool,
+) -> tuple[list, int]:
+    """
+    Resolves the targets of a mass action from IDs/mentions and/or a recent-join
+    window. Returns `(targets, skipped)`, where protected members (yourself, the
+    bot, anyone at or above your or the bot's top role) are skipped.
+    """
+    guild = interaction.guild
+    ids = checks.parse_user_ids(users) if users else []
+    if joined_minutes:
+        cutoff = discord.utils.utcnow() - timedelta(minutes=joined_minutes)
+        ids.extend(
+            member.id
+            for member in guild.members
+            if member.joined_at and member.joined_at >= cutoff
+        )
+    ids = list(dict.fromkeys(ids))
+
+    targets, skipped = [], 0
+    for user_id in ids:
+        member = guild.get_member(user_id)
+        if member is None:
+            if members_only or user_id == interaction.user.id:
+                skipped += 1
+            else:
+                targets.append(discord.Object(id=user_id))
+            continue
+        if checks.is_target_valid(interaction, member) or not checks.can_bot_moderate(
+            interaction, member
+        ):
+            skipped += 1
+            continue
+        targets.append(member)
+    return targets[:MAX_MASS_TARGETS], skipped + max(0, len(targets) - MAX_MASS_TARGETS)
+
+
+# --- The Warnings Pagination View ---
+class WarningsView(discord.ui.View):
+    """
+    Pages through a member's warnings with keyset pagination on `id`,
+    so each click fetches only the rows it shows.
+    """
+
+    def __init__(self, member: Member, total: int):
+        super().__init__(timeout=180)
+        self.member = member
+        self.total = total
+        self.page = 0
+        self.first_id = None
+        self.last_id = None
+
+    async def load_page(
+        self, before_id: int | None = None, after_id: int | None = None
+    ) -> discord.Embed:
+        # One extra row tells us whether another page exists in that direction.
+        rows = await database.get_warnings_page(
+            self.member.guild.id,
+            self.member.id,
+            before_id=before_id,
+            after_id=after_id,
+            limit=WARNINGS_PAGE_SIZE + 1,
+        )
+        has_more = len(rows) > WARNINGS_PAGE_SIZE
+        if after_id is not None:
+            rows = rows[-WARNINGS_PAGE_SIZE:]
+            has_newer, has_older = has_more, True
+        else:
+            rows = rows[:WARNINGS_PAGE_SIZE]
+            has_newer, has_older = before_id is not None, has_more
+
+        if rows:
+            self.first_id, self.last_id = rows[0][0], rows[-1][0]
+        self.previous_page.disabled = not has_newer
+        self.next_page.disabled = not has_older
+        return create_warnings_embed(self.member, self.total, rows, self.page)
+
+    @discord.ui.button(label="Previous", emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def previous_page(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await response_utils.defer(interaction)
+        self.page = max(0, self.page - 1)
+        embed = await self.load_page(after_id=self.first_id)
+        await interaction.edit_original_response(embed=embed, view=self)
+
+    @discord.ui.button(label="Next", emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await response_utils.defer(interaction)
+        self.page += 1
+        embed = await self.load_page(before_id=self.last_id)
+        await interaction.edit_original_response(embed=embed, view=self)
 
 
 class Moderation(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        try:
+            rules = escalation.parse_rules(settings.ESCALATION_RULES)
+        except ValueError as e:
+            print(f"⚠️ WARNING: {e}. Automatic escalation is disabled.")
+            rules = []
+        self.escalation = escalation.EscalationEngine(rules)
+        # One timer for every pending expiry; the jobs themselves live in the database.
+        self.expiries = HeapScheduler(self.run_expired_jobs, name="expiry")
+
+    async def cog_load(self):
+        if settings.WARNING_RETENTION_DAYS > 0:
+            self.retention_job.start()
+
+        # Anything that expired while the bot was offline is due at once.
+        jobs = await database.get_pending_jobs(UNBAN_JOB)
+        for kind, guild_id, user_id, due, reason in jobs:
+            self.expiries.schedule(
+                due, (kind, guild_id, user_id, due, reason), key=(kind, guild_id, user_id)
+            )
+        if jobs:
+            print(f"✅ Loaded {len(jobs)} pending expiry job(s).")
+
+        if not self.escalation.rules:
+            return
+        # Rebuild the sliding windows once from the timestamp index, never per warning.
+        rows = await database.get_recent_warnings(self.escalation.horizon)
+        self.escalation.load(rows)
+        print(
+            f"✅ Loaded {len(self.escalation.rules)} escalation rule(s) "
+            f"tracking {len(self.escalation)} member(s)."
+        )
+
+    async def cog_unload(self):
+        self.retention_job.cancel()
+        await self.expiries.close()
+
+    # --- EXPIRING PUNISHMENTS ---
+    async def schedule_expiry(
+        self, kind: str, guild_id: int, user_id: int, seconds: int, reason: str
+    ) -> int:
+        """Persists and schedules a job that undoes a punishment. Returns its due time."""
+        due = int(time.time()) + seconds
+        if not await database.schedule_job(kind, guild_id, user_id, due, reason):
+            print(f"⚠️ Expiry for {user_id} is not persisted and will be lost on restart.")
+        self.expiries.schedule(
+            due, (kind, guild_id, user_id, due, reason), key=(kind, guild_id, user_id)
+        )
+        return due
+
+    async def cancel_expiry(self, kind: str, guild_id: int, user_id: int):
+        self.expiries.cancel((kind, guild_id, user_id))
+        await database.delete_job(kind, guild_id, user_id)
+
+    async def run_expired_jobs(self, jobs: list):
+        for kind, guild_id, user_id, due, reason in jobs:
+            try:
+                guild = self.bot.get_guild(guild_id) or await self.bot.fetch_guild(
+                    guild_id
+                )
+                if kind == UNBAN_JOB:
+                    await guild.unban(
+                        discord.Object(id=user_id), reason="Temporary ban expired"
+                    )
+                    logger.log_action(
+                        str(self.bot.user.id),
+                        "unban",
+                        str(user_id),
+                        f"Temporary ban expired ({reason})",
+                    )
+            except discord.NotFound:
+                # Already unbanned by hand, or the bot left the guild.
+                pass
+            except discord.HTTPException as e:
+                print(f"Could not run {kind} job for {user_id}, retrying later: {e}")
+                self.expiries.schedule(
+                    time.time() + JOB_RETRY_DELAY,
+                    (kind, guild_id, user_id, due, reason),
+                    key=(kind, guild_id, user_id),
+                )
+                continue
+            # Matching on `due` keeps a job that was rescheduled meanwhile.
+            await database.delete_job(kind, guild_id, user_id, due)
+
+    # --- RETENTION JOB ---
+    @tasks.loop(hours=6)
+    async def retention_job(self):
+        moved = await database.archive_old_warnings(
+            settings.WARNING_RETENTION_DAYS, settings.RETENTION_BATCH_SIZE
+        )
+        released = await database.incremental_vacuum()
+        if moved or released:
+            print(
+                f"Retention: Archived {moved} warning(s), released {released} free page(s)."
+            )
+
+    @retention_job.before_loop
+    async def before_retention_job(self):
+        await self.bot.wait_until_ready()
+
+    async def issue_warning(
+        self,
+        member: Member,
+        moderator_id: int,
+        reason: str,
+        interaction: discord.Interaction | None = None,
+    ) -> str:
+        """
+        Stores a warning and applies any escalation rule it trips. Every warning,
+        from /warn or from automod, goes through here so the escalation windows
+        stay the same as what a restart would rebuild from the table.
+        `interaction` is the /warn that issued it, if any; automod passes none.
+        Returns a note about the escalation for the moderator, or "".
+        """
+        await database.add_warning(member.guild.id, member.id, moderator_id, reason)
+        rule = self.escalation.record(member.guild.id, member.id, time.time())
+        if rule is None:
+            return ""
+        return await self.apply_escalation(member, moderator_id, rule, interaction)
+
+    async def apply_escalation(
+        self,
+        member: Member,
+        moderator_id: int,
+        rule: escalation.EscalationRule,
+        interaction: discord.Interaction | None = None,
+    ) -> str:
+        """Carries out an escalation rule and returns a note for the moderator."""
+        reason = f"Automatic escalation: {rule.describe()}"
+
+        # The same checks /kick, /ban and /timeout run: the moderator must outrank
+        # the member, and so must the bot (automod acts as the bot itself).
+        error = checks.is_target_valid(interaction, member) if interaction else None
+        if error is None and member.top_role >= member.guild.me.top_role:
+            error = "❌ My role is not high enough to moderate this member."
+        if error:
+            why = error.removeprefix("❌ ")
+            logger.log_action(
+                str(moderator_id),
+                f"auto-{rule.action}-skipped",
+                str(member.id),
+                f"{reason} (skipped: {why})",
+            )
+            return f"\n⚠️ Escalation ({rule.describe()}) was skipped: {why}"
+
+        try:
+            if rule.action == "timeout":
+                await member.timeout(timedelta(seconds=rule.duration), reason=reason)
+            elif rule.action == "kick":
+                await member.kick(reason=reason)
+            elif rule.action == "ban":
+                await member.ban(reason=reason)
+        except discord.HTTPException as e:
+            print(f"Error applying escalation to {member.id}: {e}")
+            return f"\n⚠️ Escalation ({rule.describe()}) could not be applied: {e}"
+
+        logger.log_action(
+            str(moderator_id), f"auto-{rule.action}", str(member.id), reason
+        )
+        return f"\n🚨 Escalated: {rule.describe()}."
 
     # --- KICK COMMAND (ANONYMOUS) ---
     @app_commands.command(name="kick", description="Kicks a member from the server.")
     @app_commands.describe(member="The member to kick", reason="The reason for kicking")
     @admin_only()
     async def kick(self, interaction: discord.Interaction, member: Member, reason: str):
-        await interaction.response.defer(ephemeral=True)
+        await response_utils.defer(interaction)
         if error := checks.is_target_valid(interaction, member):
             return await interaction.edit_original_response(content=error)
 
@@ -33,13 +370,12 @@ class Moderation(commands.Cog):
                 color=discord.Color.orange(),
             )
             embed.add_field(name="Reason", value=reason, inline=False)
-            await interaction.channel.send(embed=embed)
+            await send_queue.send_embed(interaction.channel, embed)
 
             await interaction.edit_original_response(
                 content=f"✅ Successfully kicked {member.display_name}."
             )
-            await asyncio.sleep(5)
-            await interaction.delete_original_response()
+            cleanup.delete_later(interaction)
         except Exception as e:
             await interaction.edit_original_response(
                 content=f"❌ An error occurred: {e}"
@@ -47,17 +383,45 @@ class Moderation(commands.Cog):
 
     # --- BAN COMMAND (ANONYMOUS) ---
     @app_commands.command(name="ban", description="Bans a member from the server.")
-    @app_commands.describe(member="The member to ban", reason="The reason for banning")
+    @app_commands.describe(
+        member="The member to ban",
+        reason="The reason for banning",
+        duration="How long the ban lasts, e.g. 12h or 7d (default: permanent)",
+    )
     @admin_only()
-    async def ban(self, interaction: discord.Interaction, member: Member, reason: str):
-        await interaction.response.defer(ephemeral=True)
+    async def ban(
+        self,
+        interaction: discord.Interaction,
+        member: Member,
+        reason: str,
+        duration: Optional[str] = None,
+    ):
+        await response_utils.defer(interaction)
         if error := checks.is_target_valid(interaction, member):
             return await interaction.edit_original_response(content=error)
+        try:
+            seconds = escalation.parse_duration(duration) if duration is not None else 0
+        except ValueError as e:
+            return await interaction.edit_original_response(
+                content=f"❌ {e}. Use a duration like 30m, 12h or 7d."
+            )
+        if duration is not None and seconds <= 0:
+            return await interaction.edit_original_response(
+                content="❌ A temporary ban must last at least 1 second. "
+                "Leave the duration empty for a permanent ban."
+            )
 
         reason = reason or "No reason provided."
         try:
-            logger.log_action(str(interaction.user.id), "ban", str(member.id), reason)
+            action = "tempban" if seconds else "ban"
+            logger.log_action(str(interaction.user.id), action, str(member.id), reason)
             await member.ban(reason=reason)
+            if seconds:
+                due = await self.schedule_expiry(
+                    UNBAN_JOB, interaction.guild.id, member.id, seconds, reason
+                )
+            else:
+                await self.cancel_expiry(UNBAN_JOB, interaction.guild.id, member.id)
 
             embed = discord.Embed(
                 title="Member Banned",
@@ -65,13 +429,78 @@ class Moderation(commands.Cog):
                 color=discord.Color.red(),
             )
             embed.add_field(name="Reason", value=reason, inline=False)
-            await interaction.channel.send(embed=embed)
+            if seconds:
+                embed.add_field(
+                    name="Duration",
+                    value=f"{escalation.format_duration(seconds)} (lifted <t:{due}:R>)",
+                    inline=False,
+                )
+            await send_queue.send_embed(interaction.channel, embed)
 
             await interaction.edit_original_response(
                 content=f"✅ Successfully banned {member.display_name}."
             )
-            await asyncio.sleep(5)
-            await interaction.delete_original_response()
+            cleanup.delete_later(interaction)
+        except Exception as e:
+            await interaction.edit_original_response(
+                content=f"❌ An error occurred: {e}"
+            )
+
+    # --- TIMEOUT COMMAND (ANONYMOUS) ---
+    @app_commands.command(
+        name="timeout", description="Times a member out for a while."
+    )
+    @app_commands.describe(
+        member="The member to time out",
+        duration="How long the timeout lasts, e.g. 10m or 1d (at most 28d)",
+        reason="The reason for the timeout",
+    )
+    @admin_only()
+    async def timeout(
+        self, interaction: discord.Interaction, member: Member, duration: str, reason: str
+    ):
+        await response_utils.defer(interaction)
+        if error := checks.is_target_valid(interaction, member):
+            return await interaction.edit_original_response(content=error)
+        try:
+            seconds = escalation.parse_duration(duration)
+        except ValueError as e:
+            return await interaction.edit_original_response(
+                content=f"❌ {e}. Use a duration like 10m, 2h or 1d."
+            )
+        if not 0 < seconds <= escalation.MAX_TIMEOUT:
+            return await interaction.edit_original_response(
+                content="❌ Timeouts must last between 1 second and 28 days."
+            )
+
+        reason = reason or "No reason provided."
+        try:
+            # Discord lifts timeouts on its own, so no expiry job is needed.
+            await member.timeout(timedelta(seconds=seconds), reason=reason)
+            logger.log_action(
+                str(interaction.user.id),
+                "timeout",
+                str(member.id),
+                f"{reason} ({escalation.format_duration(seconds)})",
+            )
+
+            embed = discord.Embed(
+                title="Member Timed Out",
+                description=f"**{member.mention} has been timed out.**",
+                color=discord.Color.dark_orange(),
+            )
+            embed.add_field(name="Reason", value=reason, inline=False)
+            embed.add_field(
+                name="Duration",
+                value=f"{escalation.format_duration(seconds)} (ends <t:{int(time.time()) + seconds}:R>)",
+                inline=False,
+            )
+            await send_queue.send_embed(interaction.channel, embed)
+
+            await interaction.edit_original_response(
+                content=f"✅ Successfully timed out {member.display_name}."
+            )
+            cleanup.delete_later(interaction)
         except Exception as e:
             await interaction.edit_original_response(
                 content=f"❌ An error occurred: {e}"
@@ -86,12 +515,13 @@ class Moderation(commands.Cog):
     )
     @admin_only()
     async def unban(self, interaction: discord.Interaction, user_id: str, reason: str):
-        await interaction.response.defer(ephemeral=True)
+        await response_utils.defer(interaction)
         reason = reason or "No reason provided."
         try:
             user = await self.bot.fetch_user(int(user_id))
             logger.log_action(str(interaction.user.id), "unban", str(user.id), reason)
             await interaction.guild.unban(user, reason=reason)
+            await self.cancel_expiry(UNBAN_JOB, interaction.guild.id, user.id)
 
             embed = discord.Embed(
                 title="User Unbanned",
@@ -99,13 +529,12 @@ class Moderation(commands.Cog):
                 color=discord.Color.green(),
             )
             embed.add_field(name="Reason", value=reason, inline=False)
-            await interaction.channel.send(embed=embed)
+            await send_queue.send_embed(interaction.channel, embed)
 
             await interaction.edit_original_response(
                 content=f"✅ Successfully unbanned {user.name}."
             )
-            await asyncio.sleep(5)
-            await interaction.delete_original_response()
+            cleanup.delete_later(interaction)
         except (ValueError, discord.NotFound):
             await interaction.edit_original_response(
                 content=f"User with ID `{user_id}` not found or is not banned."
@@ -115,6 +544,160 @@ class Moderation(commands.Cog):
                 content=f"❌ An error occurred: {e}"
             )
 
+    # --- MASSBAN COMMAND (ANONYMOUS) ---
+    @app_commands.command(
+        name="massban", description="Bans many users at once during a raid."
+    )
+    @app_commands.describe(
+        users="User IDs and/or mentions, separated by spaces",
+        joined_minutes="Also ban every member who joined in the last N minutes",
+        reason="The reason for banning",
+        delete_days="Delete this many days of their messages (0-7)",
+    )
+    @admin_only()
+    async def massban(
+        self,
+        interaction: discord.Interaction,
+        reason: str,
+        users: Optional[str] = None,
+        joined_minutes: Optional[app_commands.Range[int, 1, 1440]] = None,
+        delete_days: app_commands.Range[int, 0, 7] = 0,
+    ):
+        await response_utils.defer(interaction)
+        targets, skipped = collect_mass_targets(
+            interaction, users, joined_minutes, members_only=False
+        )
+        if not targets:
+            return await interaction.edit_original_response(
+                content=f"❌ No valid targets found ({skipped} skipped)."
+            )
+
+        progress = ProgressReporter(interaction, "Banning", len(targets))
+        semaphore = asyncio.Semaphore(MASS_BAN_CONCURRENCY)
+        banned, failed = [], []
+
+        async def ban_one(user: discord.abc.Snowflake):
+            async with semaphore:
+                try:
+                    await interaction.guild.ban(
+                        user, reason=reason, delete_message_seconds=delete_days * 86400
+                    )
+                    banned.append(user.id)
+                except discord.HTTPException:
+                    failed.append(user.id)
+                await progress.update(len(banned) + len(failed), len(failed))
+
+        # The bulk endpoint bans up to 200 users in one request. If it is refused,
+        # this chunk and the rest are banned one by one, a few at a time, with
+        # discord.py's rate-limit buckets pacing the requests.
+        bulk = True
+        for start in range(0, len(targets), BULK_BAN_CHUNK):
+            chunk = targets[start : start + BULK_BAN_CHUNK]
+            if bulk:
+                try:
+                    result = await interaction.guild.bulk_ban(
+                        chunk,
+                        reason=reason,
+                        delete_message_seconds=delete_days * 86400,
+                    )
+                    banned.extend(user.id for user in result.banned)
+                    failed.extend(user.id for user in result.failed)
+                    await progress.update(len(banned) + len(failed), len(failed))
+                    continue
+                except discord.HTTPException as e:
+                    print(f"Bulk ban request failed, banning one by one: {e}")
+                    bulk = False
+            await asyncio.gather(*(ban_one(user) for user in chunk))
+
+        # A permanent ban replaces any temporary one, as with /ban.
+        for user_id in banned:
+            if (UNBAN_JOB, interaction.guild.id, user_id) in self.expiries:
+                await self.cancel_expiry(UNBAN_JOB, interaction.guild.id, user_id)
+
+        await self.finish_mass_action(
+            interaction, "massban", "Banned", reason, banned, failed, skipped
+        )
+
+    # --- MASSKICK COMMAND (ANONYMOUS) ---
+    @app_commands.command(
+        name="masskick", description="Kicks many members at once during a raid."
+    )
+    @app_commands.describe(
+        users="User IDs and/or mentions, separated by spaces",
+        joined_minutes="Also kick every member who joined in the last N minutes",
+        reason="The reason for kicking",
+    )
+    @admin_only()
+    async def masskick(
+        self,
+        interaction: discord.Interaction,
+        reason: str,
+        users: Optional[str] = None,
+        joined_minutes: Optional[app_commands.Range[int, 1, 1440]] = None,
+    ):
+        await response_utils.defer(interaction)
+        targets, skipped = collect_mass_targets(
+            interaction, users, joined_minutes, members_only=True
+        )
+        if not targets:
+            return await interaction.edit_original_response(
+                content=f"❌ No valid targets found ({skipped} skipped)."
+            )
+
+        # There is no bulk-kick endpoint, so run a few kicks at a time and let
+        # discord.py's rate-limit buckets pace the requests.
+        progress = ProgressReporter(interaction, "Kicking", len(targets))
+        semaphore = asyncio.Semaphore(MASS_KICK_CONCURRENCY)
+        kicked, failed = [], []
+
+        async def kick_one(member: Member):
+            async with semaphore:
+                try:
+                    await member.kick(reason=reason)
+                    kicked.append(member.id)
+                except discord.HTTPException:
+                    failed.append(member.id)
+                await progress.update(len(kicked) + len(failed), len(failed))
+
+        await asyncio.gather(*(kick_one(member) for member in targets))
+        await self.finish_mass_action(
+            interaction, "masskick", "Kicked", reason, kicked, failed, skipped
+        )
+
+    async def finish_mass_action(
+        self,
+        interaction: discord.Interaction,
+        action: str,
+        verb: str,
+        reason: str,
+        done: list,
+        failed: list,
+        skipped: int,
+    ):
+        """Writes one audit entry for the whole batch and reports the outcome."""
+        if done:
+            logger.log_action(
+                str(interaction.user.id),
+                action,
+                f"{len(done)} users",
+                f"{reason} | targets: {','.join(map(str, done))}",
+            )
+            embed = discord.Embed(
+                title=f"Mass Action: {verb} {len(done)} Users",
+                description=f"**{len(done)} accounts have been {verb.lower()}.**",
+                color=discord.Color.dark_red(),
+            )
+            embed.add_field(name="Reason", value=reason, inline=False)
+            try:
+                await send_queue.send_embed(interaction.channel, embed)
+            except discord.HTTPException as e:
+                print(f"Error sending {action} embed: {e}")
+
+        await interaction.edit_original_response(
+            content=f"✅ {verb} **{len(done)}** users. Failed: {len(failed)}. Skipped: {skipped}."
+        )
+        cleanup.delete_later(interaction, delay=30)
+
     # --- WARN COMMAND (ANONYMOUS) ---
     @app_commands.command(
         name="warn", description="Warns a member and logs it to the database."
@@ -124,16 +707,16 @@ class Moderation(commands.Cog):
     )
     @admin_only()
     async def warn(self, interaction: discord.Interaction, member: Member, reason: str):
-        await interaction.response.defer(ephemeral=True)
+        await response_utils.defer(interaction)
         if member.id == interaction.user.id:
             return await interaction.edit_original_response(
                 content="❌ You cannot warn yourself."
             )
 
-        database.add_warning(
-            interaction.guild.id, member.id, interaction.user.id, reason
-        )
         logger.log_action(str(interaction.user.id), "warn", str(member.id), reason)
+        escalation_note = await self.issue_warning(
+            member, interaction.user.id, reason, interaction
+        )
 
         embed = discord.Embed(
             title="Member Warned",
@@ -142,7 +725,7 @@ class Moderation(commands.Cog):
         )
         embed.add_field(name="Reason", value=reason, inline=False)
         try:
-            await interaction.channel.send(embed=embed)
+            await send_queue.send_embed(interaction.channel, embed)
         except discord.Forbidden:
             return await interaction.edit_original_response(
                 content="❌ I do not have permission to send messages in this channel."
@@ -153,48 +736,79 @@ class Moderation(commands.Cog):
                 content="❌ An unexpected error occurred while posting the public warning."
             )
 
+        total = await database.count_warnings(interaction.guild.id, member.id)
         await interaction.edit_original_response(
-            content=f"✅ Successfully warned {member.display_name}."
+            content=f"✅ Successfully warned {member.display_name}. They now have **{total}** warning(s)."
+            + escalation_note
         )
-        await asyncio.sleep(5)
-        await interaction.delete_original_response()
+        cleanup.delete_later(interaction)
 
-    # --- PRIVATE WARNINGS COMMAND (UNCHANGED) ---
+    # --- PRIVATE WARNINGS COMMAND ---
     @app_commands.command(
         name="warnings", description="Check a member's warning history privately."
     )
     @app_commands.describe(member="The member whose warnings you want to see")
     @admin_only()
     async def warnings(self, interaction: discord.Interaction, member: Member):
-        user_warnings = database.get_warnings(interaction.guild.id, member.id)
+        # Deferred first: the queries can wait behind a write-behind flush.
+        await response_utils.defer(interaction, ephemeral=True)
+        total = await database.count_warnings(interaction.guild.id, member.id)
+        if total == 0:
+            embed = create_warnings_embed(member, total, [], 0)
+            return await interaction.followup.send(embed=embed, ephemeral=True)
+
+        view = WarningsView(member, total)
+        embed = await view.load_page()
+        await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+
+    # --- MODLOG COMMAND ---
+    @app_commands.command(
+        name="modlog", description="Search the moderation audit log privately."
+    )
+    @app_commands.describe(
+        moderator="Only show actions taken by this moderator",
+        target="Only show actions taken against this user",
+        action="Only show this action (e.g. WARN, BAN, KICK)",
+        days="How many days back to search (default 7)",
+    )
+    @admin_only()
+    async def modlog(
+        self,
+        interaction: discord.Interaction,
+        moderator: Optional[discord.User] = None,
+        target: Optional[discord.User] = None,
+        action: Optional[str] = None,
+        days: app_commands.Range[int, 1, 365] = 7,
+    ):
+        await response_utils.defer(interaction, ephemeral=True)
+        since = int(time.time()) - days * 86400
+        entries = await database.query_audit_log(
+            moderator_id=str(moderator.id) if moderator else None,
+            target=str(target.id) if target else None,
+            action=action.strip().upper() if action else None,
+            since=since,
+            limit=MODLOG_LIMIT,
+        )
+
         embed = discord.Embed(
-            title=f"Warning History for {member.display_name}",
-            description=f"**Total Warnings: {len(user_warnings)}**",
-            color=discord.Color.orange(),
+            title="Moderation Log",
+            description=f"Showing up to {MODLOG_LIMIT} most recent entries from the last {days} day(s).",
+            color=discord.Color.dark_grey(),
         )
-        if not user_warnings:
-            embed.description += "\n\nThis user has a clean record."
-        else:
-            for i, warning in enumerate(user_warnings[:10]):
-                try:
-                    moderator = interaction.guild.get_member(warning["moderator_id"])
-                    mod_display = (
-                        moderator.display_name if moderator else "Unknown Moderator"
-                    )
-                    naive_dt = datetime.strptime(
-                        warning["timestamp"], "%Y-%m-%d %H:%M:%S"
-                    )
-                    aware_dt = naive_dt.replace(tzinfo=timezone.utc)
-                    timestamp_str = f"<t:{int(aware_dt.timestamp())}:R>"
-                    embed.add_field(
-                        name=f"Warning #{i+1} (by {mod_display})",
-                        value=f"**Reason:** `{warning['reason']}`\n**When:** {timestamp_str}",
-                        inline=False,
-                    )
-                except Exception as e:
-                    print(f"Could not parse warning #{i+1} for user {member.id}: {e}")
-                    continue
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        if not entries:
+            embed.description += "\n\nNo matching entries found."
+        lines = []
+        for epoch, moderator_id, entry_action, entry_target, reason in entries:
+            target_str = (
+                f"<@{entry_target}>" if entry_target.isdigit() else f"`{entry_target}`"
+            )
+            reason = (reason or "")[:100]
+            lines.append(
+                f"<t:{epoch}:R> **{entry_action}** by <@{moderator_id}> → {target_str}\n╰ _{reason}_"
+            )
+        if lines:
+            embed.description += "\n\n" + "\n".join(lines)[:3800]
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     # --- CLEARWARNINGS COMMAND (ANONYMOUS) ---
     @app_commands.command(
@@ -203,14 +817,15 @@ class Moderation(commands.Cog):
     @app_commands.describe(member="The member whose warnings will be cleared")
     @admin_only()
     async def clearwarnings(self, interaction: discord.Interaction, member: Member):
-        await interaction.response.defer(ephemeral=True)
-        cleared_count = database.clear_warnings(interaction.guild.id, member.id)
+        await response_utils.defer(interaction)
+        cleared_count = await database.clear_warnings(interaction.guild.id, member.id)
+        self.escalation.reset(interaction.guild.id, member.id)
         if cleared_count == 0:
             await interaction.edit_original_response(
                 content=f"ℹ️ {member.mention} had no warnings to clear."
             )
-            await asyncio.sleep(5)
-            return await interaction.delete_original_response()
+            cleanup.delete_later(interaction)
+            return
 
         logger.log_action(
             str(interaction.user.id),
@@ -223,13 +838,12 @@ class Moderation(commands.Cog):
             description=f"✅ All **{cleared_count}** warnings for {member.mention} have been cleared.",
             color=discord.Color.blue(),
         )
-        await interaction.channel.send(embed=embed)
+        await send_queue.send_embed(interaction.channel, embed)
 
         await interaction.edit_original_response(
             content=f"✅ Successfully cleared warnings for {member.display_name}."
         )
-        await asyncio.sleep(5)
-        await interaction.delete_original_response()
+        cleanup.delete_later(interaction)
 
 
 async def setup(bot):
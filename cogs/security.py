@@ -0,0 +1,209 @@
+import asyncio
+import time
+from collections import Counter
+from datetime import timedelta
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+
+from utils import database, logger, raid, response_utils
+from utils.config import settings
+from utils.decorators import admin_only
+
+# Quarantine requests are queued and handled by a few workers, so a join flood
+# never turns into an unbounded pile of tasks. Joins beyond the queue size are
+# still covered by the raised verification level.
+QUARANTINE_QUEUE_SIZE = 2000
+QUARANTINE_WORKERS = 4
+# Lockdowns are kept in the scheduled jobs table, one row per guild, so a restart
+# during a lockdown still restores the old verification level. The row's user is
+# 0, its `due` is when the lockdown ends and its `reason` holds the saved level.
+LOCKDOWN_JOB = "lockdown"
+
+
+class Security(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.detector = raid.RaidDetector(
+            settings.RAID_JOIN_THRESHOLD, settings.LOCKDOWN_MINUTES * 60
+        )
+        # Verification level each locked-down guild had before the lockdown.
+        self.saved_levels = {}
+        # Lockdown end last written to the database, per guild.
+        self.saved_until = {}
+        self.quarantine_queue = asyncio.Queue(maxsize=QUARANTINE_QUEUE_SIZE)
+        self.workers = []
+        # Joins the full quarantine queue turned away, per guild.
+        self.dropped = Counter()
+
+    async def cog_load(self):
+        # Lockdowns that were running when the bot stopped. One that has run out
+        # meanwhile is ended by the first `lockdown_watch` pass.
+        now = time.time()
+        for _, guild_id, _, due, level in await database.get_pending_jobs(LOCKDOWN_JOB):
+            try:
+                self.saved_levels[guild_id] = discord.VerificationLevel(int(level))
+            except (TypeError, ValueError):
+                print(f"⚠️ Lockdown in {guild_id} has no saved verification level.")
+                await database.delete_job(LOCKDOWN_JOB, guild_id, 0)
+                continue
+            self.saved_until[guild_id] = due
+            self.detector.start_lockdown(guild_id, now, until=due)
+        if self.saved_levels:
+            print(f"✅ Resumed {len(self.saved_levels)} raid lockdown(s).")
+
+        self.workers = [
+            asyncio.create_task(self.quarantine_worker())
+            for _ in range(QUARANTINE_WORKERS)
+        ]
+        self.lockdown_watch.start()
+
+    async def cog_unload(self):
+        self.lockdown_watch.cancel()
+        for worker in self.workers:
+            worker.cancel()
+
+    # --- LOCKDOWN ---
+    async def start_lockdown(self, guild: discord.Guild, reason: str, moderator_id: int):
+        if guild.id in self.saved_levels:
+            return
+        self.saved_levels[guild.id] = guild.verification_level
+        await self.save_lockdown(guild.id)
+        try:
+            await guild.edit(
+                verification_level=discord.VerificationLevel.highest,
+                reason=f"Raid lockdown: {reason}",
+            )
+        except discord.HTTPException as e:
+            print(f"Could not raise verification level in {guild.id}: {e}")
+        logger.log_action(str(moderator_id), "lockdown", f"guild:{guild.id}", reason)
+        print(f"🚨 Lockdown started in {guild.name}: {reason}")
+
+    async def save_lockdown(self, guild_id: int):
+        """Persists the guild's lockdown end and saved verification level."""
+        until = int(self.detector.lockdown_until(guild_id))
+        level = self.saved_levels[guild_id]
+        if not await database.schedule_job(
+            LOCKDOWN_JOB, guild_id, 0, until, str(level.value)
+        ):
+            print(f"⚠️ Lockdown in {guild_id} is not persisted and will be lost on restart.")
+        self.saved_until[guild_id] = until
+
+    async def end_lockdown(self, guild: discord.Guild, moderator_id: int) -> bool:
+        """Restores the saved verification level. Returns False if there was none."""
+        level = self.saved_levels.pop(guild.id, None)
+        self.saved_until.pop(guild.id, None)
+        if level is None:
+            return False
+        await database.delete_job(LOCKDOWN_JOB, guild.id, 0)
+        try:
+            await guild.edit(verification_level=level, reason="Raid lockdown ended")
+        except discord.HTTPException as e:
+            print(f"Could not restore verification level in {guild.id}: {e}")
+        logger.log_action(
+            str(moderator_id),
+            "lockdown-end",
+            f"guild:{guild.id}",
+            f"Quarantine queue dropped {self.dropped.pop(guild.id, 0)} join(s).",
+        )
+        print(f"✅ Lockdown ended in {guild.name}.")
+        return True
+
+    @tasks.loop(seconds=30)
+    async def lockdown_watch(self):
+        now = time.time()
+        for guild_id in list(self.saved_levels):
+            if self.detector.in_lockdown(guild_id, now):
+                # Suspicious joins extend the lockdown; the stored end follows here,
+                # at most once per pass, instead of on every join.
+                if int(self.detector.lockdown_until(guild_id)) != self.saved_until.get(guild_id):
+                    await self.save_lockdown(guild_id)
+                continue
+            guild = self.bot.get_guild(guild_id)
+            if guild:
+                await self.end_lockdown(guild, self.bot.user.id)
+            else:
+                # The bot left the guild; there is nothing left to restore.
+                self.saved_levels.pop(guild_id, None)
+                self.saved_until.pop(guild_id, None)
+                self.dropped.pop(guild_id, None)
+                await database.delete_job(LOCKDOWN_JOB, guild_id, 0)
+
+    @lockdown_watch.before_loop
+    async def before_lockdown_watch(self):
+        await self.bot.wait_until_ready()
+
+    # --- QUARANTINE ---
+    async def quarantine_worker(self):
+        while True:
+            member = await self.quarantine_queue.get()
+            try:
+                role = (
+                    member.guild.get_role(settings.QUARANTINE_ROLE_ID)
+                    if settings.QUARANTINE_ROLE_ID
+                    else None
+                )
+                if role:
+                    await member.add_roles(role, reason="Joined during raid lockdown")
+                else:
+                    await member.timeout(
+                        timedelta(minutes=settings.LOCKDOWN_MINUTES),
+                        reason="Joined during raid lockdown",
+                    )
+            except discord.HTTPException as e:
+                print(f"Could not quarantine {member.id}: {e}")
+            finally:
+                self.quarantine_queue.task_done()
+
+    # --- JOIN LISTENER ---
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if member.bot:
+            return
+        verdict = self.detector.process_join(
+            member.guild.id, member.name, member.created_at.timestamp(), time.time()
+        )
+        if verdict.lockdown_started:
+            await self.start_lockdown(
+                member.guild, "; ".join(verdict.reasons), self.bot.user.id
+            )
+        if verdict.in_lockdown:
+            try:
+                self.quarantine_queue.put_nowait(member)
+            except asyncio.QueueFull:
+                self.dropped[member.guild.id] += 1
+
+    # --- LOCKDOWN COMMAND ---
+    @app_commands.command(
+        name="lockdown", description="Manually starts or ends a raid lockdown."
+    )
+    @app_commands.describe(state="Whether to start or end the lockdown")
+    @app_commands.choices(
+        state=[
+            app_commands.Choice(name="Start", value="on"),
+            app_commands.Choice(name="End", value="off"),
+        ]
+    )
+    @admin_only()
+    async def lockdown(
+        self, interaction: discord.Interaction, state: app_commands.Choice[str]
+    ):
+        await response_utils.defer(interaction)
+        if state.value == "on":
+            self.detector.start_lockdown(interaction.guild.id, time.time())
+            await self.start_lockdown(
+                interaction.guild, "Started manually", interaction.user.id
+            )
+            message = f"🚨 Lockdown started for {settings.LOCKDOWN_MINUTES} minutes. New members will be quarantined."
+        else:
+            self.detector.end_lockdown(interaction.guild.id)
+            if await self.end_lockdown(interaction.guild, interaction.user.id):
+                message = "✅ Lockdown ended. The previous verification level was restored."
+            else:
+                message = "ℹ️ There was no lockdown to end; the verification level was left as it is."
+        await interaction.edit_original_response(content=message)
+
+
+async def setup(bot):
+    await bot.add_cog(Security(bot))
@@ -0,0 +1,96 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils import database, metrics, permissions
+from utils.decorators import admin_only
+
+
+def format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms" if seconds >= 0.01 else f"{seconds * 1000:.1f}ms"
+
+
+class Stats(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="stats", description="Shows command latency and bot health metrics."
+    )
+    @admin_only()
+    async def stats(self, interaction: discord.Interaction):
+        registry = metrics.registry
+        commands_seen = sorted(
+            {
+                command
+                for name, command in registry.histograms
+                if name == "bot_command_seconds"
+            }
+        )
+
+        rows = []
+        for command in commands_seen:
+            total = registry.histograms[("bot_command_seconds", command)]
+            parts = [
+                f"n={total.count}",
+                f"p50={format_ms(total.quantile(0.5))}",
+                f"p95={format_ms(total.quantile(0.95))}",
+            ]
+            for label, name in (
+                ("defer", "bot_defer_seconds"),
+                ("db", "bot_db_seconds"),
+                ("http", "bot_http_seconds"),
+            ):
+                histogram = registry.histograms.get((name, command))
+                if histogram:
+                    parts.append(f"{label}={format_ms(histogram.quantile(0.95))}")
+            errors = registry.counters.get(("bot_command_errors_total", command), 0)
+            if errors:
+                parts.append(f"errors={errors:.0f}")
+            rows.append(f"/{command:<14} " + " ".join(parts))
+
+        embed = discord.Embed(title="Bot Statistics", color=discord.Color.blurple())
+        embed.description = (
+            "```\n" + "\n".join(rows)[:3900] + "\n```"
+            if rows
+            else "No commands have completed since startup."
+        )
+
+        lag = registry.histograms.get(("bot_event_loop_lag_seconds", "none"))
+        if lag:
+            embed.add_field(
+                name="Event Loop Lag",
+                value=f"p50 {format_ms(lag.quantile(0.5))} · p99 {format_ms(lag.quantile(0.99))}",
+                inline=True,
+            )
+        embed.add_field(
+            name="Gateway Latency",
+            value=format_ms(self.bot.latency),
+            inline=True,
+        )
+        cache = database.count_cache_stats()
+        embed.add_field(
+            name="Warning Count Cache",
+            value=f"{cache['hits']} hits · {cache['misses']} misses ({cache['hit_rate']:.0%})",
+            inline=True,
+        )
+        cache = permissions.resolver.stats()
+        embed.add_field(
+            name="Permission Cache",
+            value=f"{cache['hits']} hits · {cache['misses']} misses ({cache['hit_rate']:.0%})",
+            inline=True,
+        )
+        info = self.bot.get_cog("Info")
+        if info is not None:
+            cache = info.snapshot.answers.stats()
+            embed.add_field(
+                name="FAQ Answer Cache",
+                value=f"{cache['hits']} hits · {cache['misses']} misses ({cache['hit_rate']:.0%})",
+                inline=True,
+            )
+        embed.set_footer(text="Latencies are p95 unless noted. defer/db/http are per command.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot):
+    await bot.add_cog(Stats(bot))
@@ -1,10 +1,10 @@
-import asyncio
 from typing import Optional
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from utils import cleanup, response_utils
 from utils.config import settings
 from utils.decorators import admin_only
 
@@ -24,7 +24,7 @@ class Task(commands.Cog):
     async def task(
         self, interaction: discord.Interaction, mentions: Optional[str] = None
     ):
-        await interaction.response.defer(ephemeral=True)
+        await response_utils.defer(interaction)
 
         if interaction.channel.id != settings.TASK_COMMAND_CHANNEL_ID:
             command_channel = self.bot.get_channel(settings.TASK_COMMAND_CHANNEL_ID)
@@ -36,8 +36,8 @@ class Task(commands.Cog):
             await interaction.edit_original_response(
                 content=f"❌ This command can only be used in the {mention_str} channel."
             )
-            await asyncio.sleep(10)
-            return await interaction.delete_original_response()
+            cleanup.delete_later(interaction, delay=10)
+            return
 
         target_channel = self.bot.get_channel(settings.TASK_TARGET_CHANNEL_ID)
         if not target_channel:
@@ -77,8 +77,7 @@ class Task(commands.Cog):
         await interaction.edit_original_response(
             content=f"✅ Successfully sent the task message to {target_channel.mention}."
         )
-        await asyncio.sleep(5)
-        await interaction.delete_original_response()
+        cleanup.delete_later(interaction)
 
 
 async def setup(bot):
@@ -0,0 +1,87 @@
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Allow running as `python debug/bench_faq_memory.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_faq_search import make_faqs  # noqa: E402
+from utils import search  # noqa: E402
+from utils.faq_store import AnswerStore  # noqa: E402
+
+
+def measure(label: str, build):
+    """Prints how much memory the object returned by `build` keeps alive."""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label}: {current / 2**20:7.1f} MiB kept · {peak / 2**20:7.1f} MiB peak")
+    return kept
+
+
+def in_memory(payload: str):
+    """The old layout: every entry parsed, plus a lowercased question -> answer dict."""
+    faqs = json.loads(payload)
+    lookup = {item["question"].lower(): item["answer"] for item in faqs}
+    return faqs, lookup
+
+
+def on_disk(payload: str):
+    """The compact layout: questions and offsets in memory, answers in an AnswerStore."""
+    faqs = json.loads(payload)
+    questions = [item["question"] for item in faqs]
+    answers = AnswerStore(item["answer"] for item in faqs)
+    return questions, answers
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares FAQ memory use with answers in memory vs on disk."
+    )
+    parser.add_argument("--entries", type=int, default=50_000)
+    parser.add_argument("--reads", type=int, default=20_000)
+    args = parser.parse_args()
+    rng = random.Random(2024)
+
+    faqs = make_faqs(args.entries, rng)
+    payload = json.dumps(faqs)
+    answer_bytes = sum(len(item["answer"].encode("utf-8")) for item in faqs)
+    del faqs
+    print(f"{args.entries:,} entries · {answer_bytes / 2**20:.1f} MiB of answer text")
+
+    measure("In memory", lambda: in_memory(payload))
+    questions, answers = measure("On disk  ", lambda: on_disk(payload))
+    # Both layouts share the autocomplete index, which replaces the lookup dict.
+    measure("Autocomplete index", lambda: search.FaqIndex(questions))
+    measure(
+        "Full-text index   ",
+        lambda: search.FullTextIndex(
+            [(item["question"], item["answer"]) for item in json.loads(payload)]
+        ),
+    )
+
+    # Popular questions get asked far more often, so reads are skewed.
+    weights = [1 / (rank + 1) for rank in range(len(answers))]
+    picks = rng.choices(range(len(answers)), weights, k=args.reads)
+    start = time.perf_counter()
+    for i in picks:
+        answers.get(i)
+    elapsed = time.perf_counter() - start
+    stats = answers.stats()
+    print(
+        f"{args.reads:,} answer reads: {elapsed / args.reads * 1e6:.1f} µs each · "
+        f"{stats['hit_rate']:.0%} cache hits"
+    )
+    answers.close()
+
+
+if __name__ == "__main__":
+    main()
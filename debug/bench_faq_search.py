@@ -0,0 +1,139 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+# Allow running as `python debug/bench_faq_search.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import search  # noqa: E402
+
+# --- Benchmark Configuration ---
+OPENERS = ["How do I", "What is", "Can I", "Why does", "Where can I find", "When will", "Who can"]
+VOCABULARY_SIZE = 8_000
+
+
+def make_vocabulary(rng: random.Random) -> list:
+    words = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 11))))
+    # Shuffled, so frequent words are spread over the alphabet as in real text.
+    words = sorted(words)
+    rng.shuffle(words)
+    return words
+
+
+def make_faqs(entries: int, rng: random.Random) -> list:
+    """Builds a synthetic faq.json payload with Zipf-like word frequencies."""
+    vocabulary = make_vocabulary(rng)
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    faqs, seen = [], set()
+    while len(faqs) < entries:
+        words = rng.choices(vocabulary, weights, k=rng.randint(3, 10))
+        question = f"{rng.choice(OPENERS)} {' '.join(words)}?"
+        if question in seen:
+            continue
+        seen.add(question)
+        answer = " ".join(rng.choices(vocabulary, weights, k=rng.randint(20, 120)))
+        faqs.append({"question": question, "answer": answer.capitalize() + "."})
+    return faqs
+
+
+def typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    return word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1 :]
+
+
+def make_queries(questions: list, count: int, rng: random.Random) -> list:
+    """Keystroke-style queries: question prefixes, word prefixes and typos."""
+    queries = []
+    for _ in range(count):
+        words = rng.choice(questions).rstrip("?").split()
+        kind = rng.random()
+        if kind < 0.4:
+            text = " ".join(words)
+            queries.append(text[: rng.randint(1, len(text))])
+        elif kind < 0.8:
+            content = words[2:] or words
+            picked = rng.sample(content, k=min(2, len(content)))
+            queries.append(" ".join(w[: rng.randint(min(2, len(w)), len(w))] for w in picked))
+        else:
+            word = max(words, key=len)
+            queries.append(typo(word, rng))
+    return queries
+
+
+def naive_search(questions: list, query: str) -> list:
+    """The old autocomplete: a substring scan over every question."""
+    return [q for q in questions if query.lower() in q.lower()][:25]
+
+
+def make_text_queries(faqs: list, count: int, rng: random.Random) -> list:
+    """One to three words taken from a random entry, as someone might search for them."""
+    queries = []
+    for _ in range(count):
+        item = rng.choice(faqs)
+        words = f"{item['question']} {item['answer']}".rstrip("?.").split()
+        queries.append(" ".join(rng.sample(words, k=rng.randint(1, 3))))
+    return queries
+
+
+def bench_full_text(faqs: list, queries: list):
+    start = time.perf_counter()
+    index = search.FullTextIndex([(item["question"], item["answer"]) for item in faqs])
+    print(f"BM25-indexed {len(index):,} entries in {time.perf_counter() - start:.2f}s")
+    timed(f"BM25 ({len(index):>7,})", index.search, queries)
+
+
+def timed(label: str, search_fn, queries: list):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        search_fn(query)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{label}: p50 {statistics.median(samples):.3f} ms · p99 {p99:.3f} ms · max {samples[-1]:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures /info autocomplete and /faq search latency over a synthetic FAQ."
+    )
+    parser.add_argument("--entries", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--write", metavar="PATH", help="also save the synthetic faq.json here")
+    args = parser.parse_args()
+    rng = random.Random(2024)
+
+    faqs = make_faqs(args.entries, rng)
+    if args.write:
+        with open(args.write, "w", encoding="utf-8") as f:
+            json.dump(faqs, f, indent=1)
+        print(f"Wrote {len(faqs):,} entries to {args.write}")
+    questions = [item["question"] for item in faqs]
+
+    start = time.perf_counter()
+    index = search.FaqIndex(questions)
+    print(f"Indexed {len(index):,} questions in {time.perf_counter() - start:.2f}s")
+
+    queries = make_queries(questions, args.queries, rng)
+    timed("Index      ", index.search, queries)
+    timed("Linear scan", lambda q: naive_search(questions, q), queries[:200])
+
+    for query in ("how do i", "wher can", typo(max(questions[0].split(), key=len), rng)):
+        top = [questions[i] for i in index.search(query, limit=3)]
+        print(f"  {query!r} → {top}")
+
+    # Same queries against a tenth of the entries: latency should barely move.
+    text_queries = make_text_queries(faqs, args.queries, rng)
+    bench_full_text(faqs[: len(faqs) // 10], text_queries)
+    bench_full_text(faqs, text_queries)
+
+
+if __name__ == "__main__":
+    main()
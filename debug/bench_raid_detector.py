@@ -0,0 +1,91 @@
+import argparse
+import os
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+# Allow running as `python debug/bench_raid_detector.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import raid  # noqa: E402
+
+# --- Benchmark Configuration ---
+JOIN_THRESHOLD = 10
+LOCKDOWN_SECONDS = 15 * 60
+START = 1_700_000_000.0
+YEAR = 365 * 86400
+
+
+def normal_stream(joins: int, per_minute: int, rng: random.Random):
+    """Organic traffic: established accounts with unrelated names."""
+    gap = 60 / per_minute
+    for i in range(joins):
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+        yield name, START - rng.uniform(YEAR, 5 * YEAR), START + i * gap
+
+
+def flood_stream(joins: int, per_minute: int, rng: random.Random, offset: float):
+    """A raid: brand-new accounts with near-identical names, arriving fast."""
+    gap = 60 / per_minute
+    for i in range(joins):
+        now = offset + i * gap
+        yield f"raider_{rng.randint(0, 9999):04d}", now - rng.uniform(0, 3600), now
+
+
+def replay(detector: raid.RaidDetector, stream, guild_id: int):
+    """Feeds a stream through the detector; returns (joins, seconds, first lockdown time)."""
+    joins, detected = 0, None
+    start = time.perf_counter()
+    for name, created_at, now in stream:
+        verdict = detector.process_join(guild_id, name, created_at, now)
+        if verdict.lockdown_started and detected is None:
+            detected = now
+        joins += 1
+    return joins, time.perf_counter() - start, detected
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replays synthetic join streams through the raid detector."
+    )
+    parser.add_argument("--normal", type=int, default=5_000)
+    parser.add_argument("--flood", type=int, default=10_000)
+    parser.add_argument("--flood-rate", type=int, default=10_000, help="joins per minute")
+    parser.add_argument("--guilds", type=int, default=1_000)
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    detector = raid.RaidDetector(JOIN_THRESHOLD, LOCKDOWN_SECONDS)
+    joins, seconds, detected = replay(detector, normal_stream(args.normal, 5, rng), 1)
+    print(f"Normal traffic: {joins:,} joins, {seconds * 1e6 / joins:.2f} µs per join, "
+          f"lockdown {'TRIGGERED (false positive)' if detected else 'not triggered'}")
+
+    offset = START + args.normal * 12 + 3600
+    joins, seconds, detected = replay(
+        detector, flood_stream(args.flood, args.flood_rate, rng, offset), 1
+    )
+    if detected is None:
+        print(f"Flood: {joins:,} joins, {seconds * 1e6 / joins:.2f} µs per join, NOT detected")
+    else:
+        print(f"Flood: {joins:,} joins at {args.flood_rate:,}/min, "
+              f"{seconds * 1e6 / joins:.2f} µs per join, detected after "
+              f"{(detected - offset) * 1000:.0f} ms "
+              f"({int((detected - offset) * args.flood_rate / 60) + 1} joins)")
+
+    # Memory per guild stays flat no matter how many joins it has seen.
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    detector = raid.RaidDetector(JOIN_THRESHOLD, LOCKDOWN_SECONDS)
+    for guild_id in range(args.guilds):
+        replay(detector, flood_stream(200, args.flood_rate, rng, START), guild_id)
+    after = tracemalloc.take_snapshot()
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    tracemalloc.stop()
+    print(f"Memory: {used / 1024:.0f} KiB for {args.guilds:,} flooded guilds "
+          f"({used / args.guilds:.0f} bytes per guild)")
+
+
+if __name__ == "__main__":
+    main()
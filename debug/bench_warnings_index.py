@@ -0,0 +1,94 @@
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+# Allow running as `python debug/bench_warnings_index.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import database, migrations  # noqa: E402
+
+# --- Benchmark Configuration ---
+GUILD_COUNT = 5
+USER_COUNT = 50_000
+
+
+def seed(conn: sqlite3.Connection, rows: int):
+    """Fills the warnings table with `rows` synthetic warnings."""
+    rng = random.Random(1234)
+    batch = []
+    conn.execute("BEGIN")
+    for i in range(rows):
+        day = rng.randint(1, 28)
+        batch.append(
+            (
+                rng.randint(1, GUILD_COUNT),
+                rng.randint(1, USER_COUNT),
+                rng.randint(1, 50),
+                f"Synthetic warning #{i}",
+                f"2025-{rng.randint(1, 12):02d}-{day:02d} 12:00:00",
+            )
+        )
+        if len(batch) == 50_000:
+            conn.executemany(
+                "INSERT INTO warnings (guild_id, user_id, moderator_id, reason, timestamp) VALUES (?, ?, ?, ?, ?)",
+                batch,
+            )
+            batch.clear()
+    if batch:
+        conn.executemany(
+            "INSERT INTO warnings (guild_id, user_id, moderator_id, reason, timestamp) VALUES (?, ?, ?, ?, ?)",
+            batch,
+        )
+    conn.commit()
+
+
+def measure(conn: sqlite3.Connection, lookups: int) -> float:
+    """Returns the mean get_warnings latency in milliseconds."""
+    rng = random.Random(99)
+    keys = [
+        (rng.randint(1, GUILD_COUNT), rng.randint(1, USER_COUNT))
+        for _ in range(lookups)
+    ]
+    start = time.perf_counter()
+    for guild_id, user_id in keys:
+        database._get_warnings(conn, guild_id, user_id)
+    return (time.perf_counter() - start) * 1000 / lookups
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures warning lookup latency before and after the index migration."
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "bench.db"))
+        conn.row_factory = sqlite3.Row
+        migrations.apply_migrations(conn, target=1)
+
+        print(f"Seeding {args.rows:,} warnings...")
+        start = time.perf_counter()
+        seed(conn, args.rows)
+        print(f"Seeded in {time.perf_counter() - start:.1f}s")
+
+        before = measure(conn, args.lookups)
+        print(f"Before migration: {before:.3f} ms per lookup")
+
+        start = time.perf_counter()
+        version = migrations.apply_migrations(conn)
+        print(f"Migrated to version {version} in {time.perf_counter() - start:.1f}s")
+
+        after = measure(conn, args.lookups)
+        print(f"After migration:  {after:.3f} ms per lookup")
+        print(f"Speedup: {before / after:.1f}x")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 import asyncio
 import os
+import sys
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+# Allow running as `python debug/clear_commands.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import command_sync  # noqa: E402
+
 # --- Configuration & Bot Definition ---
 load_dotenv()
 BOT_TOKEN = os.getenv("BOT_TOKEN")
@@ -21,13 +27,15 @@ class ClearBot(commands.Bot):
 
         # 1. Clear all commands for the specific guild
         guild_obj = discord.Object(id=GUILD_ID)
+        # Synced through command_sync so the stored hash records the empty tree,
+        # and the bot's next start syncs its commands again.
         self.tree.clear_commands(guild=guild_obj)
-        await self.tree.sync(guild=guild_obj)
+        await command_sync.sync_if_changed(self.tree, guild_obj, force=True)
         print(f"✅ Cleared all commands for guild: {GUILD_ID}")
 
         # 2. Clear all global commands
         self.tree.clear_commands(guild=None)
-        await self.tree.sync(guild=None)
+        await command_sync.sync_if_changed(self.tree, None, force=True)
         print("✅ Cleared all global commands.")
 
         print("--- Command cache cleared. You can now stop this script (Ctrl+C). ---")
@@ -1,9 +1,15 @@
 import os
+import sys
 
 import discord
 from discord import app_commands
 from dotenv import load_dotenv
 
+# Allow running as `python debug/test_sync.py` from the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import command_sync  # noqa: E402
+
 # --- Load Configuration ---
 load_dotenv()
 BOT_TOKEN = os.getenv("BOT_TOKEN")
@@ -29,8 +35,14 @@ async def ping(interaction: discord.Interaction):
 async def on_ready():
     print(f"Logged in as {client.user}!")
     print("Attempting to sync commands...")
+    guild_obj = discord.Object(id=GUILD_ID)
+    if command_sync.stored_hash(command_sync.scope_key(client.application_id, guild_obj)):
+        print(
+            "ℹ️ This replaces the bot's synced commands; its next start will sync them again."
+        )
     try:
-        synced = await tree.sync(guild=discord.Object(id=GUILD_ID))
+        # Forced, and the stored hash updated to this tree, so the bot notices the change.
+        synced = await command_sync.sync_if_changed(tree, guild_obj, force=True)
         print(f"--- Synced {len(synced)} commands ---")
         if len(synced) > 0:
             print("✅ SUCCESS: Commands have been synced.")
@@ -1,11 +1,13 @@
+import argparse
 import asyncio
 import os
+import time
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from utils import response_utils
+from utils import command_sync, metrics, permissions, response_utils
 from utils.config import settings
 
 
@@ -16,8 +18,17 @@ class ModeratorBot(commands.Bot):
         intents.message_content = True
         super().__init__(command_prefix="!", intents=intents)
         self.tree.interaction_check = self.is_in_guild
+        self.loop_monitor = None
+        self.metrics_server = None
+        # Set by --force-sync to sync commands even if they look unchanged.
+        self.force_sync = False
 
     async def is_in_guild(self, interaction: discord.Interaction) -> bool:
+        # Runs first for every interaction, in the same task as the command itself.
+        interaction.extras["started"] = time.perf_counter()
+        metrics.current_command.set(
+            interaction.command.qualified_name if interaction.command else "unknown"
+        )
         if interaction.guild is None:
             await interaction.response.send_message(
                 "❌ My commands can only be used inside a server.", ephemeral=True
@@ -28,8 +39,13 @@ class ModeratorBot(commands.Bot):
     async def setup_hook(self):
         from utils.database import init_db
 
+        self.instrument_http()
+        self.loop_monitor = asyncio.create_task(metrics.monitor_event_loop())
+        if settings.METRICS_PORT:
+            self.metrics_server = await metrics.start_exporter(settings.METRICS_PORT)
+
         print("Database: Initializing...")
-        init_db()
+        await init_db(incremental_vacuum=settings.WARNING_RETENTION_DAYS > 0)
 
         print("--- Loading Cogs ---")
         cog_map = {
@@ -38,6 +54,10 @@ class ModeratorBot(commands.Bot):
             "info.py": settings.ENABLE_COG_INFO,
             "help.py": settings.ENABLE_COG_HELP,
             "task.py": settings.ENABLE_COG_TASK,
+            "data.py": settings.ENABLE_COG_DATA,
+            "stats.py": settings.ENABLE_COG_STATS,
+            "security.py": settings.ENABLE_COG_SECURITY,
+            "automod.py": settings.ENABLE_COG_AUTOMOD,
         }
 
         for filename, is_enabled in cog_map.items():
@@ -54,11 +74,70 @@ class ModeratorBot(commands.Bot):
         guild_obj = discord.Object(id=settings.GUILD_ID)
         self.tree.copy_global_to(guild=guild_obj)
         try:
-            synced = await self.tree.sync(guild=guild_obj)
-            print(f"--- Synced {len(synced)} commands to the guild. ---")
+            synced = await command_sync.sync_if_changed(
+                self.tree, guild_obj, force=self.force_sync
+            )
+            if synced is None:
+                print("--- Commands unchanged since the last sync, skipping it. ---")
+            else:
+                print(f"--- Synced {len(synced)} commands to the guild. ---")
         except Exception as e:
             print(f"❌ FAILED TO SYNC: {e}")
 
+    async def add_cog(self, cog: commands.Cog, /, **kwargs):
+        await super().add_cog(cog, **kwargs)
+        self.dispatch("cogs_changed")
+
+    async def remove_cog(self, name: str, /, **kwargs):
+        cog = await super().remove_cog(name, **kwargs)
+        self.dispatch("cogs_changed")
+        return cog
+
+    def instrument_http(self):
+        """Times every Discord REST request against the command that made it."""
+        request = self.http.request
+
+        async def timed_request(route, **kwargs):
+            with metrics.timer("bot_http_seconds"):
+                return await request(route, **kwargs)
+
+        self.http.request = timed_request
+
+    async def on_app_command_completion(
+        self, interaction: discord.Interaction, command: app_commands.Command
+    ):
+        started = interaction.extras.get("started")
+        if started is not None:
+            metrics.observe("bot_command_seconds", time.perf_counter() - started)
+
+    # --- PERMISSION CACHE INVALIDATION ---
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles:
+            permissions.resolver.invalidate(after.guild.id, after.id)
+
+    async def on_member_remove(self, member: discord.Member):
+        permissions.resolver.invalidate(member.guild.id, member.id)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        permissions.resolver.invalidate_all()
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        permissions.resolver.invalidate_all()
+
+    async def close(self):
+        from utils import cleanup, logger, send_queue
+        from utils.database import close_db
+
+        await cleanup.shutdown()
+        send_queue.shutdown()
+        if self.loop_monitor:
+            self.loop_monitor.cancel()
+        if self.metrics_server:
+            self.metrics_server.close()
+        await super().close()
+        await close_db()
+        await asyncio.to_thread(logger.shutdown)
+
     async def on_ready(self):
         print("-----------------------------------------")
         print(f"✅ Logged in as {self.user}")
@@ -76,6 +155,11 @@ async def on_app_command_error(
     """
     Catches all errors from slash commands globally.
     """
+    metrics.inc("bot_command_errors_total")
+    started = interaction.extras.get("started")
+    if started is not None:
+        metrics.observe("bot_command_seconds", time.perf_counter() - started)
+
     if isinstance(error, app_commands.CheckFailure):
         # This error is raised when a decorator check (like @admin_only) fails.
         await response_utils.send_error_message(
@@ -95,6 +179,14 @@ async def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs the moderation bot.")
+    parser.add_argument(
+        "--force-sync",
+        action="store_true",
+        help="sync slash commands even if they are unchanged since the last sync",
+    )
+    bot.force_sync = parser.parse_args().force_sync
+
     if not os.path.exists("logs"):
         os.makedirs("logs")
     try:
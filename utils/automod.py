@@ -0,0 +1,314 @@
+import itertools
+import re
+from collections import deque
+from typing import NamedTuple
+
+KINDS = ("word", "link", "regex")
+ACTIONS = ("delete", "warn", "timeout")  # in increasing order of severity
+
+# Cached transitions per trie node; bounds memory on text with many distinct characters.
+MAX_CACHED_TRANSITIONS = 256
+# Newly added literals go into a small automaton that is merged into the main
+# one once it holds this many, so adding a rule never relinks the whole trie.
+RECENT_LIMIT = 64
+
+# Backreferences would point at the wrong group once regex rules are combined,
+# and named groups would clash with the ones the rules are wrapped in.
+_BACKREFERENCE = re.compile(r"\\\d|\(\?P=")
+_NAMED_GROUP = re.compile(r"\(\?P?<(?![=!])")
+_LINK_PREFIX = re.compile(r"^(?:[a-z][a-z0-9+.-]*://)?(?:www\.)?")
+
+
+class AutomodRule(NamedTuple):
+    id: int
+    kind: str
+    pattern: str
+    action: str
+
+    @property
+    def severity(self) -> int:
+        return ACTIONS.index(self.action)
+
+    def describe(self) -> str:
+        return f"#{self.id} {self.kind} `{self.pattern}` → {self.action}"
+
+
+def normalize_pattern(kind: str, pattern: str) -> str:
+    """
+    Validates a rule pattern and returns the form it is matched in.
+    Raises ValueError if the pattern cannot be used.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown rule kind '{kind}'")
+    pattern = pattern.strip()
+    if not pattern:
+        raise ValueError("The pattern is empty")
+    if kind == "regex":
+        if _BACKREFERENCE.search(pattern):
+            raise ValueError("Regex rules cannot use backreferences")
+        if _NAMED_GROUP.search(pattern):
+            raise ValueError("Regex rules cannot use named groups")
+        # Compiled as typed first, so error positions match what the moderator wrote.
+        try:
+            re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"Invalid regex: {e}")
+        # Then in the form rules are combined in, so inline global flags such as
+        # (?i) fail here instead of breaking every other rule of the guild.
+        try:
+            compiled = re.compile(f"(?P<r0>{pattern})", re.IGNORECASE)
+        except re.error as e:
+            if "global flags" in str(e):
+                raise ValueError(
+                    "Regex rules cannot use inline flags like (?i); they already ignore case"
+                )
+            raise ValueError(f"Regex rules cannot be combined with this pattern: {e.msg}")
+        if compiled.match(""):
+            raise ValueError("Regex rules must not match an empty message")
+        return pattern
+    pattern = pattern.casefold()
+    if kind == "link":
+        pattern = _LINK_PREFIX.sub("", pattern).rstrip("/")
+    return pattern
+
+
+class AhoCorasick:
+    """
+    Matches any number of literal patterns in one pass over the text.
+
+    Patterns are inserted into a trie as they are added; the failure links are
+    recomputed lazily on the next scan, in time linear in the size of the trie.
+    Removing a pattern only forgets it, and its stale outputs are skipped until
+    the next relink. Transitions resolved during scans are cached per node, so
+    the common case is one dict lookup per character.
+    """
+
+    def __init__(self):
+        self._goto = [{}]
+        self._own = [set()]  # values of the patterns ending exactly at each node
+        self._fail = [0]
+        self._out = [()]
+        self._delta = [{}]
+        self._dirty = False
+        self._patterns = {}  # value -> (pattern, node)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def items(self):
+        """Yields `(value, pattern)` for every pattern in the automaton."""
+        for value, (pattern, _) in self._patterns.items():
+            yield value, pattern
+
+    def add(self, pattern: str, value):
+        """Adds a pattern; `scan` reports `value` wherever it occurs."""
+        self.remove(value)
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._own.append(set())
+            node = nxt
+        self._own[node].add((value, len(pattern)))
+        self._patterns[value] = (pattern, node)
+        self._dirty = True
+
+    def remove(self, value) -> bool:
+        entry = self._patterns.pop(value, None)
+        if entry is None:
+            return False
+        pattern, node = entry
+        self._own[node].discard((value, len(pattern)))
+        return True
+
+    def _build(self):
+        goto = self._goto
+        fail = [0] * len(goto)
+        out = [()] * len(goto)
+        out[0] = tuple(self._own[0])
+        queue = deque()
+        for child in goto[0].values():
+            out[child] = tuple(self._own[child])
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(ch, 0)
+                fail[child] = target if target != child else 0
+                out[child] = tuple(self._own[child]) + out[fail[child]]
+                queue.append(child)
+        self._fail = fail
+        self._out = out
+        self._delta = [dict(edges) for edges in goto]
+        self._dirty = False
+
+    def _step(self, state: int, ch: str) -> int:
+        goto, fail = self._goto, self._fail
+        while state and ch not in goto[state]:
+            state = fail[state]
+        return goto[state].get(ch, 0)
+
+    def scan(self, text: str):
+        """Yields `(start, end, value)` for every pattern occurrence in `text`."""
+        if self._dirty:
+            self._build()
+        if not self._patterns:
+            return
+        delta, out, patterns = self._delta, self._out, self._patterns
+        state = 0
+        for end, ch in enumerate(text, start=1):
+            edges = delta[state]
+            nxt = edges.get(ch)
+            if nxt is None:
+                nxt = self._step(state, ch)
+                if len(edges) < MAX_CACHED_TRANSITIONS:
+                    edges[ch] = nxt
+            state = nxt
+            for value, length in out[state]:
+                if value in patterns:
+                    yield end - length, end, value
+
+
+def _is_boundary(text: str, start: int, end: int) -> bool:
+    """True if the match is not part of a longer word (or domain label)."""
+    return (start == 0 or not text[start - 1].isalnum()) and (
+        end == len(text) or not text[end].isalnum()
+    )
+
+
+class GuildFilter:
+    """The compiled automod rules of one guild."""
+
+    def __init__(self):
+        self.rules = {}
+        self.literals = AhoCorasick()
+        self.recent = AhoCorasick()
+        self._regex = None
+        self._regexes = []  # (compiled, rule) pairs, only if the combined compile failed
+        self._regex_dirty = False
+
+    def add(self, rule: AutomodRule, bulk: bool = False):
+        """Adds a rule. `bulk` skips the small automaton when loading many rules at once."""
+        self.remove(rule.id)
+        self.rules[rule.id] = rule
+        if rule.kind == "regex":
+            self._regex_dirty = True
+        elif bulk:
+            self.literals.add(rule.pattern, rule.id)
+        else:
+            self.recent.add(rule.pattern, rule.id)
+            if len(self.recent) >= RECENT_LIMIT:
+                for rule_id, pattern in self.recent.items():
+                    self.literals.add(pattern, rule_id)
+                self.recent = AhoCorasick()
+
+    def remove(self, rule_id: int) -> bool:
+        rule = self.rules.pop(rule_id, None)
+        if rule is None:
+            return False
+        if rule.kind == "regex":
+            self._regex_dirty = True
+        else:
+            if not self.literals.remove(rule_id):
+                self.recent.remove(rule_id)
+        return True
+
+    def _compile_regex(self):
+        # One alternation of named groups, so every regex rule is tried in a single pass.
+        parts = [
+            f"(?P<r{rule.id}>{rule.pattern})"
+            for rule in self.rules.values()
+            if rule.kind == "regex"
+        ]
+        self._regex_dirty = False
+        try:
+            self._regex = re.compile("|".join(parts), re.IGNORECASE) if parts else None
+            self._regexes = []
+        except re.error as e:
+            # Rules saved before they were validated as combined; try them one by one.
+            print(
+                f"⚠️ Automod regex rules could not be combined, checking them separately: {e}"
+            )
+            self._regex = None
+            self._regexes = []
+            for rule in self.rules.values():
+                if rule.kind != "regex":
+                    continue
+                try:
+                    self._regexes.append(
+                        (re.compile(rule.pattern, re.IGNORECASE), rule)
+                    )
+                except re.error as e:
+                    print(f"⚠️ Skipping automod rule {rule.describe()}: {e}")
+
+    def match(self, content: str) -> AutomodRule | None:
+        """Returns the most severe rule the content breaks, if any."""
+        text = content.casefold()
+        worst = None
+        hits = itertools.chain(self.literals.scan(text), self.recent.scan(text))
+        for start, end, rule_id in hits:
+            rule = self.rules[rule_id]
+            if (worst is None or rule.severity > worst.severity) and _is_boundary(
+                text, start, end
+            ):
+                worst = rule
+                if worst.severity == len(ACTIONS) - 1:
+                    return worst
+
+        if self._regex_dirty:
+            self._compile_regex()
+        if self._regex is not None:
+            for found in self._regex.finditer(content):
+                if found.end() == found.start():
+                    continue
+                rule = self.rules[int(found.lastgroup[1:])]
+                if worst is None or rule.severity > worst.severity:
+                    worst = rule
+        for regex, rule in self._regexes:
+            if (worst is None or rule.severity > worst.severity) and any(
+                found.end() > found.start() for found in regex.finditer(content)
+            ):
+                worst = rule
+        return worst
+
+
+class AutomodEngine:
+    """Per-guild automod filters that are updated rule by rule as they change."""
+
+    def __init__(self):
+        self._guilds = {}
+
+    def __len__(self) -> int:
+        return sum(len(guild.rules) for guild in self._guilds.values())
+
+    def load(self, rows):
+        """Replaces every filter with `(id, guild_id, kind, pattern, action)` rows."""
+        self._guilds.clear()
+        for rule_id, guild_id, kind, pattern, action in rows:
+            self.add(guild_id, AutomodRule(rule_id, kind, pattern, action), bulk=True)
+
+    def add(self, guild_id: int, rule: AutomodRule, bulk: bool = False):
+        guild = self._guilds.get(guild_id)
+        if guild is None:
+            guild = self._guilds[guild_id] = GuildFilter()
+        guild.add(rule, bulk)
+
+    def remove(self, guild_id: int, rule_id: int) -> bool:
+        guild = self._guilds.get(guild_id)
+        return guild is not None and guild.remove(rule_id)
+
+    def rules(self, guild_id: int) -> list:
+        guild = self._guilds.get(guild_id)
+        return sorted(guild.rules.values()) if guild else []
+
+    def check(self, guild_id: int, content: str) -> AutomodRule | None:
+        guild = self._guilds.get(guild_id)
+        if guild is None or not guild.rules:
+            return None
+        return guild.match(content)
@@ -1,3 +1,5 @@
+import re
+
 import discord
 
 
@@ -18,3 +20,19 @@ def is_target_valid(
         return "❌ You cannot moderate a member with an equal or higher role."
 
     return None
+
+
+USER_ID_PATTERN = re.compile(r"\d{15,20}")
+
+
+def parse_user_ids(text: str) -> list[int]:
+    """
+    Extracts user IDs from a free-form list of IDs and/or mentions, keeping order
+    and dropping duplicates.
+    """
+    return list(dict.fromkeys(int(match) for match in USER_ID_PATTERN.findall(text)))
+
+
+def can_bot_moderate(interaction: discord.Interaction, target: discord.Member) -> bool:
+    """Returns True if the bot's own top role is above the target's."""
+    return target.top_role < interaction.guild.me.top_role
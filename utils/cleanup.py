@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+import discord
+
+from .scheduler import HeapScheduler
+
+# How many deletions may be in flight at once when a batch comes due.
+DELETE_CONCURRENCY = 10
+
+
+async def _delete_batch(interactions: list):
+    semaphore = asyncio.Semaphore(DELETE_CONCURRENCY)
+
+    async def delete(interaction: discord.Interaction):
+        async with semaphore:
+            try:
+                await interaction.delete_original_response()
+            except discord.HTTPException:
+                # Already deleted by the user, or the interaction token expired.
+                pass
+
+    await asyncio.gather(*(delete(interaction) for interaction in interactions))
+
+
+# One shared scheduler replaces a parked `asyncio.sleep` per command.
+scheduler = HeapScheduler(_delete_batch, name="cleanup")
+
+
+def delete_later(interaction: discord.Interaction, delay: float = 5):
+    """
+    Deletes the interaction's original response after `delay` seconds.
+    Returns immediately, so the command can finish right away.
+    """
+    scheduler.schedule(time.time() + delay, interaction)
+
+
+async def shutdown():
+    """Cancels every pending deletion. Call once when the bot shuts down."""
+    await scheduler.close()
@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+
+import discord
+from discord import app_commands
+
+SYNC_STATE_FILE = "command_sync.json"
+
+
+# --- Hashing ---
+async def tree_payload(
+    tree: app_commands.CommandTree, guild: discord.abc.Snowflake | None
+) -> list:
+    """The command payload `tree.sync(guild=guild)` would upload, in a stable order."""
+    commands = tree.get_commands(guild=guild)
+    if tree.translator:
+        payload = [
+            await command.get_translated_payload(tree, tree.translator)
+            for command in commands
+        ]
+    else:
+        payload = [command.to_dict(tree) for command in commands]
+    return sorted(payload, key=lambda command: (command.get("type", 1), command["name"]))
+
+
+async def tree_hash(
+    tree: app_commands.CommandTree, guild: discord.abc.Snowflake | None
+) -> str:
+    payload = await tree_payload(tree, guild)
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+# --- Stored Hashes ---
+def scope_key(application_id: int, guild: discord.abc.Snowflake | None) -> str:
+    """Hashes are kept per application and guild ("global" for global commands)."""
+    return f"{application_id}:{guild.id if guild else 'global'}"
+
+
+def load_hashes(path: str = SYNC_STATE_FILE) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            hashes = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not read {path}, commands will be synced: {e}")
+        return {}
+    return hashes if isinstance(hashes, dict) else {}
+
+
+def stored_hash(key: str, path: str = SYNC_STATE_FILE) -> str | None:
+    return load_hashes(path).get(key)
+
+
+def save_hash(key: str, digest: str | None, path: str = SYNC_STATE_FILE):
+    """Records the hash last synced for `key`; None forgets it, forcing the next sync."""
+    hashes = load_hashes(path)
+    if digest is None:
+        hashes.pop(key, None)
+    else:
+        hashes[key] = digest
+    # Written to a temporary file first, so a crash never leaves a half-written file.
+    temporary = f"{path}.tmp"
+    try:
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(hashes, f, indent=2, sort_keys=True)
+        os.replace(temporary, path)
+    except OSError as e:
+        print(f"⚠️ Could not save {path}, commands will be synced again next start: {e}")
+
+
+# --- Syncing ---
+async def sync_if_changed(
+    tree: app_commands.CommandTree,
+    guild: discord.abc.Snowflake | None,
+    force: bool = False,
+) -> list | None:
+    """
+    Syncs the tree's commands for `guild` unless they hash the same as at the
+    last sync. Returns the synced commands, or None if the sync was skipped.
+    """
+    key = scope_key(tree.client.application_id, guild)
+    digest = await tree_hash(tree, guild)
+    if not force and stored_hash(key) == digest:
+        return None
+    # Forgotten first: if the sync fails midway, the next start retries it.
+    save_hash(key, None)
+    synced = await tree.sync(guild=guild)
+    save_hash(key, digest)
+    return synced
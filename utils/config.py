@@ -16,6 +16,8 @@ class Config:
         self.BOT_TOKEN = self._get_env_var("BOT_TOKEN")
         self.GUILD_ID = self._get_env_var("GUILD_ID", cast_to=int)
         self.ADMIN_ROLE_ID = self._get_env_var("ADMIN_ROLE_ID", cast_to=int)
+        # Comma-separated role IDs that may use moderator-level commands (admins always can).
+        self.MODERATOR_ROLE_IDS = self._get_id_list_env_var("MODERATOR_ROLE_IDS")
         self.TASK_COMMAND_CHANNEL_ID = self._get_env_var(
             "TASK_COMMAND_CHANNEL_ID", cast_to=int
         )
@@ -24,12 +26,60 @@ class Config:
         )
         self.TASK_MESSAGE = self._get_env_var("TASK_MESSAGE")
 
+        # --- Moderation ---
+        # Comma-separated 'COUNT/WINDOW=ACTION[:DURATION]' rules, e.g. '3/24h=timeout:1h, 5/7d=kick'.
+        self.ESCALATION_RULES = self._get_env_var("ESCALATION_RULES", default="")
+        # Warnings older than this many days are moved to the archive database (0 = keep forever).
+        self.WARNING_RETENTION_DAYS = self._get_env_var(
+            "WARNING_RETENTION_DAYS", default=0, cast_to=int
+        )
+        self.RETENTION_BATCH_SIZE = self._get_env_var(
+            "RETENTION_BATCH_SIZE", default=500, cast_to=int
+        )
+
+        # --- Raid Protection ---
+        # Joins within 10 seconds that trigger a lockdown.
+        self.RAID_JOIN_THRESHOLD = self._get_env_var(
+            "RAID_JOIN_THRESHOLD", default=10, cast_to=int
+        )
+        self.LOCKDOWN_MINUTES = self._get_env_var(
+            "LOCKDOWN_MINUTES", default=15, cast_to=int
+        )
+        # Role given to members who join during a lockdown (0 = time them out instead).
+        self.QUARANTINE_ROLE_ID = self._get_env_var(
+            "QUARANTINE_ROLE_ID", default=0, cast_to=int
+        )
+
+        # --- Automod ---
+        # How long members are timed out for breaking a 'timeout' automod rule.
+        self.AUTOMOD_TIMEOUT_MINUTES = self._get_env_var(
+            "AUTOMOD_TIMEOUT_MINUTES", default=10, cast_to=int
+        )
+
+        # --- FAQ ---
+        # How often faq.json is checked for changes and reloaded (0 = only on /faq reload).
+        self.FAQ_WATCH_SECONDS = self._get_env_var(
+            "FAQ_WATCH_SECONDS", default=30, cast_to=int
+        )
+        # FAQ answers live on disk; this many recently used ones are also kept in memory.
+        self.FAQ_ANSWER_CACHE_SIZE = self._get_env_var(
+            "FAQ_ANSWER_CACHE_SIZE", default=128, cast_to=int
+        )
+
+        # --- Metrics ---
+        # Local port for the Prometheus-style metrics endpoint (0 = disabled).
+        self.METRICS_PORT = self._get_env_var("METRICS_PORT", default=0, cast_to=int)
+
         # --- Cog Enable/Disable Switches ---
         self.ENABLE_COG_MODERATION = self._get_boolean_env_var("ENABLE_COG_MODERATION")
         self.ENABLE_COG_MESSAGING = self._get_boolean_env_var("ENABLE_COG_MESSAGING")
         self.ENABLE_COG_INFO = self._get_boolean_env_var("ENABLE_COG_INFO")
         self.ENABLE_COG_HELP = self._get_boolean_env_var("ENABLE_COG_HELP")
         self.ENABLE_COG_TASK = self._get_boolean_env_var("ENABLE_COG_TASK")
+        self.ENABLE_COG_DATA = self._get_boolean_env_var("ENABLE_COG_DATA")
+        self.ENABLE_COG_STATS = self._get_boolean_env_var("ENABLE_COG_STATS")
+        self.ENABLE_COG_SECURITY = self._get_boolean_env_var("ENABLE_COG_SECURITY")
+        self.ENABLE_COG_AUTOMOD = self._get_boolean_env_var("ENABLE_COG_AUTOMOD")
 
     def _get_env_var(self, key: str, default=None, cast_to=str):
         """Helper to get a required environment variable."""
@@ -43,6 +93,14 @@ class Config:
         except (ValueError, TypeError):
             raise ValueError(f"❌ Invalid format for environment variable: {key}")
 
+    def _get_id_list_env_var(self, key: str) -> list:
+        """Helper to get an optional comma-separated list of IDs. Defaults to empty."""
+        value = os.getenv(key, "")
+        try:
+            return [int(item) for item in value.split(",") if item.strip()]
+        except ValueError:
+            raise ValueError(f"❌ Invalid format for environment variable: {key}")
+
     def _get_boolean_env_var(self, key: str) -> bool:
         """Helper to get an enable/disable switch. Defaults to True."""
         value = os.getenv(key, "True").lower()
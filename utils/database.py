@@ -1,81 +1,281 @@
+import asyncio
 import sqlite3
-import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# --- DATABASE INITIALIZATION ---
+from . import metrics, migrations
+from .cache import LRUCache
+
+DB_PATH = "moderation.db"
+ARCHIVE_DB_PATH = "moderation_archive.db"
+
+# --- DATABASE WORKER ---
+
+# Every query runs on one dedicated worker thread that owns the connection,
+# so a slow disk never stalls the event loop (and with it the gateway heartbeat).
+_executor = None
+_connection = None
 
-# Use thread-local data to ensure thread safety for database connections
-local_storage = threading.local()
 
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-worker")
+    return _executor
 
-def get_db_connection():
+
+def get_db_connection() -> sqlite3.Connection:
     """
-    Establishes a thread-safe database connection.
-    Creates the database and table if they don't exist.
+    Returns the worker thread's database connection, opening it on first use.
+    Only call this from code that is already running on the DB worker thread.
     """
-    if not hasattr(local_storage, "connection"):
-        local_storage.connection = sqlite3.connect(
-            "moderation.db", check_same_thread=False
-        )
-        local_storage.connection.row_factory = sqlite3.Row
-    return local_storage.connection
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(DB_PATH, check_same_thread=False)
+        _connection.row_factory = sqlite3.Row
+        # WAL lets readers proceed while a write is committing.
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute("PRAGMA busy_timeout=5000")
+    return _connection
+
+
+def _call(func, args):
+    return func(get_db_connection(), *args)
 
 
-def init_db():
+async def run(func, *args):
     """
-    Initializes the database and creates the 'warnings' table if it's missing.
-    This function should be called once when the bot starts up.
+    Runs `func(connection, *args)` on the DB worker thread and awaits its result.
     """
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+    loop = asyncio.get_running_loop()
+    with metrics.timer("bot_db_seconds"):
+        return await loop.run_in_executor(_get_executor(), _call, func, args)
 
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS warnings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                moderator_id INTEGER NOT NULL,
-                reason TEXT NOT NULL,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            );
+
+def _close(conn: sqlite3.Connection):
+    global _connection
+    conn.close()
+    _connection = None
+
+
+async def close_db():
+    """
+    Commits any queued warnings, then closes the connection and stops the worker thread.
+    This function should be called once when the bot shuts down.
+    """
+    global _executor
+    if _executor is None:
+        return
+    await flush_warnings()
+    if _connection is not None:
+        await run(_close)
+    _executor.shutdown(wait=True)
+    _executor = None
+    print("Database: Connection closed.")
+
+
+# --- WRITE-BEHIND QUEUE ---
+
+# A burst of warnings is committed as one transaction (one fsync) instead of one each.
+BATCH_DELAY = 0.005  # seconds to wait for more rows before committing
+BATCH_SIZE = 200  # commit immediately once this many rows are pending
+
+
+class WriteBehindQueue:
+    """
+    Buffers warning inserts on the event loop and hands them to the DB worker
+    in batches, either every `delay` seconds or as soon as `max_rows` are pending.
+    """
+
+    def __init__(self, delay: float, max_rows: int):
+        self.delay = delay
+        self.max_rows = max_rows
+        self._rows = []
+        self._futures = []
+        self._timer = None
+        self._in_flight = set()
+
+    def enqueue(self, row: tuple) -> asyncio.Future:
+        """
+        Queues a row and returns a future that resolves once the row is committed,
+        or raises the sqlite3.Error that kept it from being written.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._rows.append(row)
+        self._futures.append(future)
+
+        if len(self._rows) >= self.max_rows:
+            self.submit()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.delay, self.submit)
+        return future
+
+    def submit(self):
         """
+        Hands all pending rows to the DB worker right away. Because the worker
+        runs jobs in order, any query submitted afterwards sees these rows.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._rows:
+            return
+
+        rows, futures = self._rows, self._futures
+        self._rows, self._futures = [], []
+
+        loop = asyncio.get_running_loop()
+        commit = loop.run_in_executor(
+            _get_executor(), _call, _insert_warnings, (rows,)
         )
+        self._in_flight.add(commit)
 
-        conn.commit()
-        print("Database: 'warnings' table initialized successfully.")
+        def _done(fut: asyncio.Future):
+            self._in_flight.discard(fut)
+            if fut.cancelled():
+                for future in futures:
+                    future.cancel()
+                return
+            if fut.exception() is not None:
+                errors = [fut.exception()] * len(rows)
+            else:
+                errors = fut.result()
+            for row, future, error in zip(rows, futures, errors):
+                if error is None:
+                    future.set_result(None)
+                    continue
+                # The total was written through for a row that never landed.
+                _invalidate_count(row[0], row[1])
+                future.set_exception(error)
+                future.exception()  # mark retrieved; durable callers still see it
+
+        commit.add_done_callback(_done)
+
+    async def flush(self):
+        """Submits pending rows and waits for every in-flight batch to commit."""
+        self.submit()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+
+_write_queue = WriteBehindQueue(BATCH_DELAY, BATCH_SIZE)
+
+
+# --- WARNING COUNT CACHE ---
+
+# Totals per (guild_id, user_id), kept current by writing through on every add.
+COUNT_CACHE_SIZE = 10_000
+_count_cache = LRUCache(COUNT_CACHE_SIZE)
+# Tokens for in-flight cache fills; a write in the meantime discards the fill.
+_count_loads = {}
+
+
+def _invalidate_count(guild_id: int, user_id: int):
+    _count_cache.pop((guild_id, user_id))
+    _count_loads.pop((guild_id, user_id), None)
+
+
+def invalidate_counts():
+    """Drops every cached total, e.g. after rows were written outside this module."""
+    _count_cache.clear()
+    _count_loads.clear()
+
+
+def count_cache_stats() -> dict:
+    """Returns size and hit/miss statistics for the warning count cache."""
+    return _count_cache.stats()
+
+
+# --- DATABASE INITIALIZATION ---
+
+
+def _init_db(conn: sqlite3.Connection, incremental_vacuum: bool):
+    try:
+        version = migrations.apply_migrations(conn)
+        print(f"Database: Schema is at version {version}.")
+
+        # Freed pages are only returned by `incremental_vacuum` once auto_vacuum is
+        # INCREMENTAL, and switching an existing file over needs one full VACUUM.
+        # That VACUUM rewrites the whole file, so it is only worth it when retention
+        # actually deletes warnings.
+        if incremental_vacuum and conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            print("Database: Enabled incremental vacuum.")
 
     except sqlite3.Error as e:
         print(f"Database error during initialization: {e}")
-    finally:
-        # The connection is kept open for the bot's lifecycle
-        pass
+
+
+async def init_db(incremental_vacuum: bool = False):
+    """
+    Initializes the database and applies any pending schema migrations.
+    This function should be called once when the bot starts up.
+    `incremental_vacuum` switches the file to incremental auto-vacuum, which
+    warning retention needs to hand freed pages back to the OS.
+    """
+    await run(_init_db, incremental_vacuum)
 
 
 # --- DATABASE FUNCTIONS ---
 
 
-def add_warning(guild_id: int, user_id: int, moderator_id: int, reason: str):
+def _insert_warnings(conn: sqlite3.Connection, rows: list) -> list:
     """
-    Adds a warning for a user to the database.
+    Inserts a batch of warnings in one transaction. If that fails, the rows
+    are retried one by one so a single bad row cannot lose the whole batch.
+    Returns the sqlite3.Error for each row that was not written, else None.
     """
-    conn = get_db_connection()
+    query = "INSERT INTO warnings (guild_id, user_id, moderator_id, reason) VALUES (?, ?, ?, ?)"
     try:
-        conn.execute(
-            "INSERT INTO warnings (guild_id, user_id, moderator_id, reason) VALUES (?, ?, ?, ?)",
-            (guild_id, user_id, moderator_id, reason),
-        )
+        conn.executemany(query, rows)
         conn.commit()
-        print(f"Database: Logged warning for user {user_id} in guild {guild_id}.")
+        print(f"Database: Logged {len(rows)} warning(s) in one transaction.")
+        return [None] * len(rows)
     except sqlite3.Error as e:
-        print(f"Database error on add_warning: {e}")
+        conn.rollback()
+        print(f"Database error on add_warning batch, retrying row by row: {e}")
 
+    errors = []
+    for row in rows:
+        try:
+            conn.execute(query, row)
+            conn.commit()
+            errors.append(None)
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"Database error on add_warning: {e}")
+            errors.append(e)
+    return errors
 
-def get_warnings(guild_id: int, user_id: int) -> list:
+
+async def add_warning(
+    guild_id: int, user_id: int, moderator_id: int, reason: str, durable: bool = False
+):
     """
-    Retrieves all warnings for a specific user in a guild.
+    Queues a warning for a user to be written to the database.
+    Returns once the warning is queued, or once it is committed if `durable` is True;
+    a durable write that fails raises its sqlite3.Error.
+    """
+    written = _write_queue.enqueue((guild_id, user_id, moderator_id, reason))
+
+    key = (guild_id, user_id)
+    _count_loads.pop(key, None)
+    if key in _count_cache:
+        _count_cache.put(key, _count_cache.pop(key) + 1)
+    if durable:
+        # Raises the sqlite3.Error if this warning could not be committed.
+        await asyncio.shield(written)
+
+
+async def flush_warnings():
+    """
+    Commits every queued warning and waits until they are durable on disk.
     """
-    conn = get_db_connection()
+    await _write_queue.flush()
+
+
+def _get_warnings(conn: sqlite3.Connection, guild_id: int, user_id: int) -> list:
     try:
         cursor = conn.cursor()
         cursor.execute(
@@ -89,12 +289,127 @@ def get_warnings(guild_id: int, user_id: int) -> list:
         return []
 
 
-def clear_warnings(guild_id: int, user_id: int) -> int:
+async def get_warnings(guild_id: int, user_id: int) -> list:
     """
-    Clears all warnings for a specific user in a guild.
-    Returns the number of warnings removed.
+    Retrieves all warnings for a specific user in a guild.
+    """
+    _write_queue.submit()
+    return await run(_get_warnings, guild_id, user_id)
+
+
+def _count_warnings(conn: sqlite3.Connection, guild_id: int, user_id: int) -> int:
+    try:
+        # warning_counts is kept in sync by triggers, so this is a single key lookup.
+        row = conn.execute(
+            "SELECT count FROM warning_counts WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id),
+        ).fetchone()
+        return row[0] if row else 0
+    except sqlite3.Error as e:
+        print(f"Database error on count_warnings: {e}")
+        return 0
+
+
+async def count_warnings(guild_id: int, user_id: int) -> int:
     """
-    conn = get_db_connection()
+    Returns how many warnings a user has in a guild, served from cache when possible.
+    """
+    key = (guild_id, user_id)
+    total = _count_cache.get(key)
+    if total is not None:
+        return total
+
+    token = _count_loads[key] = object()
+    _write_queue.submit()
+    total = await run(_count_warnings, guild_id, user_id)
+    if _count_loads.get(key) is token:
+        del _count_loads[key]
+        _count_cache.put(key, total)
+    return total
+
+
+def _get_warnings_page(
+    conn: sqlite3.Connection,
+    guild_id: int,
+    user_id: int,
+    before_id: int | None,
+    after_id: int | None,
+    limit: int,
+) -> list:
+    if after_id is not None:
+        # Walk towards newer rows, then flip back to newest-first order.
+        query = (
+            "SELECT id, moderator_id, reason, timestamp FROM warnings "
+            "WHERE guild_id = ? AND user_id = ? AND id > ? ORDER BY id ASC LIMIT ?"
+        )
+        params = (guild_id, user_id, after_id, limit)
+    elif before_id is not None:
+        query = (
+            "SELECT id, moderator_id, reason, timestamp FROM warnings "
+            "WHERE guild_id = ? AND user_id = ? AND id < ? ORDER BY id DESC LIMIT ?"
+        )
+        params = (guild_id, user_id, before_id, limit)
+    else:
+        query = (
+            "SELECT id, moderator_id, reason, timestamp FROM warnings "
+            "WHERE guild_id = ? AND user_id = ? ORDER BY id DESC LIMIT ?"
+        )
+        params = (guild_id, user_id, limit)
+
+    try:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        rows = cursor.execute(query, params).fetchall()
+        if after_id is not None:
+            rows.reverse()
+        return rows
+    except sqlite3.Error as e:
+        print(f"Database error on get_warnings_page: {e}")
+        return []
+
+
+async def get_warnings_page(
+    guild_id: int,
+    user_id: int,
+    before_id: int | None = None,
+    after_id: int | None = None,
+    limit: int = 10,
+) -> list:
+    """
+    Fetches one page of a user's warnings, newest first, using keyset pagination on `id`.
+    Pass `before_id` for the next (older) page or `after_id` for the previous (newer) one.
+    Rows are plain `(id, moderator_id, reason, timestamp)` tuples.
+    """
+    _write_queue.submit()
+    return await run(
+        _get_warnings_page, guild_id, user_id, before_id, after_id, limit
+    )
+
+
+def _get_recent_warnings(conn: sqlite3.Connection, seconds: int) -> list:
+    try:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
+            "SELECT guild_id, user_id, CAST(strftime('%s', timestamp) AS INTEGER) "
+            "FROM warnings WHERE timestamp >= datetime('now', ?) ORDER BY timestamp",
+            (f"-{seconds} seconds",),
+        ).fetchall()
+    except sqlite3.Error as e:
+        print(f"Database error on get_recent_warnings: {e}")
+        return []
+
+
+async def get_recent_warnings(seconds: int) -> list:
+    """
+    Returns `(guild_id, user_id, epoch_seconds)` for every warning issued in the
+    last `seconds`, oldest first.
+    """
+    _write_queue.submit()
+    return await run(_get_recent_warnings, seconds)
+
+
+def _clear_warnings(conn: sqlite3.Connection, guild_id: int, user_id: int) -> int:
     try:
         cursor = conn.cursor()
         cursor.execute(
@@ -106,3 +421,321 @@ def clear_warnings(guild_id: int, user_id: int) -> int:
     except sqlite3.Error as e:
         print(f"Database error on clear_warnings: {e}")
         return 0
+
+
+async def clear_warnings(guild_id: int, user_id: int) -> int:
+    """
+    Clears all warnings for a specific user in a guild.
+    Returns the number of warnings removed.
+    """
+    _invalidate_count(guild_id, user_id)
+    _write_queue.submit()
+    removed = await run(_clear_warnings, guild_id, user_id)
+    _invalidate_count(guild_id, user_id)
+    return removed
+
+
+# --- RETENTION ---
+
+
+def _attach_archive(conn: sqlite3.Connection):
+    attached = {row[1] for row in conn.execute("PRAGMA database_list")}
+    if "archive" not in attached:
+        conn.execute("ATTACH DATABASE ? AS archive", (ARCHIVE_DB_PATH,))
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS archive.warnings (
+                id INTEGER PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                moderator_id INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                timestamp DATETIME,
+                archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+
+
+def _archive_batch(conn: sqlite3.Connection, max_age_days: int, batch_size: int) -> list:
+    try:
+        _attach_archive(conn)
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        rows = cursor.execute(
+            "SELECT id, guild_id, user_id, moderator_id, reason, timestamp FROM warnings "
+            "WHERE timestamp < datetime('now', ?) ORDER BY timestamp LIMIT ?",
+            (f"-{max_age_days} days", batch_size),
+        ).fetchall()
+        if not rows:
+            return []
+
+        # Copy before deleting: a crash in between leaves a duplicate, never a loss.
+        cursor.executemany(
+            "INSERT OR IGNORE INTO archive.warnings "
+            "(id, guild_id, user_id, moderator_id, reason, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        cursor.executemany(
+            "DELETE FROM warnings WHERE id = ?", [(row[0],) for row in rows]
+        )
+        conn.commit()
+        return [(row[1], row[2]) for row in rows]
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"Database error on archive_old_warnings: {e}")
+        return []
+
+
+async def archive_old_warnings(
+    max_age_days: int, batch_size: int = 500, pause: float = 0.5
+) -> int:
+    """
+    Moves warnings older than `max_age_days` into the archive database.
+    Works in small batches with a pause between them, so no single transaction
+    holds the write lock long enough to delay `/warn`. Returns the number moved.
+    """
+    moved = 0
+    while True:
+        keys = await run(_archive_batch, max_age_days, batch_size)
+        for guild_id, user_id in set(keys):
+            _invalidate_count(guild_id, user_id)
+        moved += len(keys)
+        if len(keys) < batch_size:
+            return moved
+        await asyncio.sleep(pause)
+
+
+def _freelist_count(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+
+def _incremental_vacuum(conn: sqlite3.Connection, pages: int) -> int:
+    try:
+        # A page count of 0 would release every free page at once, holding the lock.
+        conn.execute(f"PRAGMA incremental_vacuum({max(1, int(pages))})").fetchall()
+        return _freelist_count(conn)
+    except sqlite3.Error as e:
+        print(f"Database error on incremental_vacuum: {e}")
+        return 0
+
+
+async def incremental_vacuum(pages: int = 256, pause: float = 0.1) -> int:
+    """
+    Returns free pages to the filesystem `pages` at a time, pausing between steps.
+    Returns the number of pages released.
+    """
+    start = remaining = await run(_freelist_count)
+    while remaining:
+        left = await run(_incremental_vacuum, pages)
+        if left >= remaining:
+            break
+        remaining = left
+        await asyncio.sleep(pause)
+    return start - remaining
+
+
+# --- AUDIT LOG QUERIES ---
+
+
+def _query_audit_log(
+    conn: sqlite3.Connection,
+    moderator_id: str | None,
+    target: str | None,
+    action: str | None,
+    since: int | None,
+    limit: int,
+) -> list:
+    clauses, params = [], []
+    for column, value in (
+        ("moderator_id", moderator_id),
+        ("target", target),
+        ("action", action),
+    ):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if since is not None:
+        clauses.append("timestamp >= ?")
+        params.append(since)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    try:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
+            "SELECT timestamp, moderator_id, action, target, reason FROM audit_log "
+            f"{where} ORDER BY timestamp DESC LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+    except sqlite3.Error as e:
+        print(f"Database error on query_audit_log: {e}")
+        return []
+
+
+async def query_audit_log(
+    moderator_id: str | None = None,
+    target: str | None = None,
+    action: str | None = None,
+    since: int | None = None,
+    limit: int = 25,
+) -> list:
+    """
+    Returns the newest audit log entries matching every given filter as
+    `(epoch_seconds, moderator_id, action, target, reason)` tuples.
+    Each filter has its own `(column, timestamp)` index, so this stays fast
+    no matter how large the log grows.
+    """
+    return await run(_query_audit_log, moderator_id, target, action, since, limit)
+
+
+# --- AUTOMOD RULES ---
+
+
+def _add_automod_rule(
+    conn: sqlite3.Connection,
+    guild_id: int,
+    kind: str,
+    pattern: str,
+    action: str,
+    created_by: int,
+) -> int | None:
+    try:
+        cursor = conn.execute(
+            "INSERT INTO automod_rules (guild_id, kind, pattern, action, created_by) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (guild_id, kind, pattern, action, created_by),
+        )
+        conn.commit()
+        return cursor.lastrowid
+    except sqlite3.Error as e:
+        print(f"Database error on add_automod_rule: {e}")
+        return None
+
+
+async def add_automod_rule(
+    guild_id: int, kind: str, pattern: str, action: str, created_by: int
+) -> int | None:
+    """Stores an automod rule and returns its ID, or None if it could not be saved."""
+    return await run(_add_automod_rule, guild_id, kind, pattern, action, created_by)
+
+
+def _remove_automod_rule(conn: sqlite3.Connection, guild_id: int, rule_id: int) -> bool:
+    try:
+        cursor = conn.execute(
+            "DELETE FROM automod_rules WHERE guild_id = ? AND id = ?",
+            (guild_id, rule_id),
+        )
+        conn.commit()
+        return cursor.rowcount > 0
+    except sqlite3.Error as e:
+        print(f"Database error on remove_automod_rule: {e}")
+        return False
+
+
+async def remove_automod_rule(guild_id: int, rule_id: int) -> bool:
+    """Deletes an automod rule. Returns False if the guild has no such rule."""
+    return await run(_remove_automod_rule, guild_id, rule_id)
+
+
+def _get_automod_rules(conn: sqlite3.Connection) -> list:
+    try:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
+            "SELECT id, guild_id, kind, pattern, action FROM automod_rules ORDER BY id"
+        ).fetchall()
+    except sqlite3.Error as e:
+        print(f"Database error on get_automod_rules: {e}")
+        return []
+
+
+async def get_automod_rules() -> list:
+    """Returns every automod rule as `(id, guild_id, kind, pattern, action)` tuples."""
+    return await run(_get_automod_rules)
+
+
+# --- SCHEDULED JOBS ---
+
+
+def _schedule_job(
+    conn: sqlite3.Connection,
+    kind: str,
+    guild_id: int,
+    user_id: int,
+    due: int,
+    reason: str,
+) -> bool:
+    try:
+        conn.execute(
+            "INSERT INTO scheduled_jobs (kind, guild_id, user_id, due, reason) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (kind, guild_id, user_id) "
+            "DO UPDATE SET due = excluded.due, reason = excluded.reason",
+            (kind, guild_id, user_id, due, reason),
+        )
+        conn.commit()
+        return True
+    except sqlite3.Error as e:
+        print(f"Database error on schedule_job: {e}")
+        return False
+
+
+async def schedule_job(
+    kind: str, guild_id: int, user_id: int, due: int, reason: str
+) -> bool:
+    """
+    Persists a job that runs at `due` (epoch seconds), replacing any pending job
+    of the same kind for the same user. Returns False if it could not be saved.
+    """
+    return await run(_schedule_job, kind, guild_id, user_id, due, reason)
+
+
+def _delete_job(
+    conn: sqlite3.Connection, kind: str, guild_id: int, user_id: int, due: int | None
+) -> bool:
+    query = "DELETE FROM scheduled_jobs WHERE kind = ? AND guild_id = ? AND user_id = ?"
+    params = [kind, guild_id, user_id]
+    if due is not None:
+        query += " AND due = ?"
+        params.append(due)
+    try:
+        cursor = conn.execute(query, params)
+        conn.commit()
+        return cursor.rowcount > 0
+    except sqlite3.Error as e:
+        print(f"Database error on delete_job: {e}")
+        return False
+
+
+async def delete_job(
+    kind: str, guild_id: int, user_id: int, due: int | None = None
+) -> bool:
+    """
+    Deletes a pending job. With `due`, only deletes it if it was not rescheduled
+    in the meantime. Returns False if there was no such job.
+    """
+    return await run(_delete_job, kind, guild_id, user_id, due)
+
+
+def _get_pending_jobs(conn: sqlite3.Connection, kinds: tuple | None) -> list:
+    query = "SELECT kind, guild_id, user_id, due, reason FROM scheduled_jobs"
+    params = ()
+    if kinds is not None:
+        query += f" WHERE kind IN ({', '.join('?' * len(kinds))})"
+        params = tuple(kinds)
+    try:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(query + " ORDER BY due", params).fetchall()
+    except sqlite3.Error as e:
+        print(f"Database error on get_pending_jobs: {e}")
+        return []
+
+
+async def get_pending_jobs(*kinds: str) -> list:
+    """
+    Returns every pending job as `(kind, guild_id, user_id, due, reason)`, soonest
+    first. With `kinds`, only returns jobs of those kinds.
+    """
+    return await run(_get_pending_jobs, kinds or None)
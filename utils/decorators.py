@@ -1,16 +1,30 @@
-from discord import Interaction, app_commands, utils
+from discord import Interaction, app_commands
 
-from .config import settings
+from .permissions import Tier, resolver
 
 
-def is_admin(interaction: Interaction) -> bool:
-    """The raw check function."""
-    admin_role = utils.get(interaction.guild.roles, id=settings.ADMIN_ROLE_ID)
-    if not admin_role:
-        return False
-    return admin_role in interaction.user.roles
+def require_tier(tier: Tier):
+    """
+    A decorator that checks if the user holds `tier`. The tier is also recorded
+    on the command's callback, so it can be looked up without running the check.
+    """
+
+    def predicate(interaction: Interaction) -> bool:
+        return resolver.has_tier(interaction.user, tier)
+
+    def decorator(func):
+        callback = func.callback if isinstance(func, app_commands.Command) else func
+        callback.__permission_tier__ = tier
+        return app_commands.check(predicate)(func)
+
+    return decorator
 
 
 def admin_only():
     """A decorator that checks if the user is an admin."""
-    return app_commands.check(is_admin)
+    return require_tier(Tier.ADMIN)
+
+
+def moderator_only():
+    """A decorator that checks if the user is a moderator or an admin."""
+    return require_tier(Tier.MODERATOR)
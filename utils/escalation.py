@@ -0,0 +1,160 @@
+import re
+from collections import OrderedDict, deque
+from typing import NamedTuple
+
+# --- DURATIONS ---
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_DURATION_PART = re.compile(r"(\d+)([smhdw])")
+
+
+def parse_duration(text: str) -> int:
+    """
+    Parses a compact duration such as '30m', '24h' or '1d12h' into seconds.
+    Raises ValueError if the text is not a valid duration.
+    """
+    text = text.strip().lower()
+    parts = _DURATION_PART.findall(text)
+    if not parts or "".join(n + u for n, u in parts) != text:
+        raise ValueError(f"Invalid duration: '{text}'")
+    return sum(int(n) * DURATION_UNITS[u] for n, u in parts)
+
+
+def format_duration(seconds: int) -> str:
+    """Formats seconds in the same compact form `parse_duration` accepts, e.g. '1d12h'."""
+    parts = []
+    for unit in ("w", "d", "h", "m", "s"):
+        amount, seconds = divmod(seconds, DURATION_UNITS[unit])
+        if amount:
+            parts.append(f"{amount}{unit}")
+    return "".join(parts) or "0s"
+
+
+# --- RULES ---
+
+# Actions in increasing order of severity.
+ACTIONS = ("timeout", "kick", "ban")
+# Discord caps member timeouts at 28 days.
+MAX_TIMEOUT = 28 * 86400
+
+
+class EscalationRule(NamedTuple):
+    count: int
+    window: int  # seconds
+    action: str
+    duration: int = 0  # seconds, only used by "timeout"
+
+    @property
+    def severity(self) -> tuple:
+        return (ACTIONS.index(self.action), self.duration)
+
+    def describe(self) -> str:
+        action = self.action
+        if action == "timeout":
+            action += f" ({format_duration(self.duration)})"
+        return f"{self.count} warnings in {format_duration(self.window)} → {action}"
+
+
+def parse_rules(spec: str) -> list[EscalationRule]:
+    """
+    Parses rules written as 'COUNT/WINDOW=ACTION[:DURATION]', separated by commas.
+    Example: '3/24h=timeout:1h, 5/7d=kick'. Raises ValueError on malformed rules.
+    """
+    rules = []
+    for raw in spec.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            threshold, action = raw.split("=", 1)
+            count, window = threshold.split("/", 1)
+            action, _, duration = action.strip().lower().partition(":")
+            rule = EscalationRule(
+                count=int(count),
+                window=parse_duration(window),
+                action=action,
+                duration=parse_duration(duration) if duration else 0,
+            )
+        except ValueError:
+            raise ValueError(f"Invalid escalation rule: '{raw}'")
+
+        if rule.count < 1 or rule.action not in ACTIONS:
+            raise ValueError(f"Invalid escalation rule: '{raw}'")
+        if rule.action == "timeout" and not 0 < rule.duration <= MAX_TIMEOUT:
+            raise ValueError(f"Timeout duration must be between 1s and 28d: '{raw}'")
+        rules.append(rule)
+    return rules
+
+
+# --- SLIDING-WINDOW ENGINE ---
+
+
+class EscalationEngine:
+    """
+    Tracks recent warning times per (guild_id, user_id) and reports which rule,
+    if any, a new warning trips. Each rule keeps only its last `count` timestamps,
+    so recording a warning costs O(number of rules) regardless of history size.
+    """
+
+    def __init__(self, rules: list[EscalationRule]):
+        self.rules = rules
+        self.horizon = max((rule.window for rule in rules), default=0)
+        # Ordered by last activity, so idle members can be dropped from the front.
+        self._windows = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def _append(self, key: tuple, when: float) -> list:
+        windows = self._windows.get(key)
+        if windows is None:
+            windows = self._windows[key] = [
+                deque(maxlen=rule.count) for rule in self.rules
+            ]
+        else:
+            self._windows.move_to_end(key)
+        for window in windows:
+            window.append(when)
+        return windows
+
+    def _prune(self, now: float):
+        # The front entry is the least recently warned member; stop at the first live one.
+        while self._windows:
+            key, windows = next(iter(self._windows.items()))
+            if windows and now - windows[0][-1] <= self.horizon:
+                break
+            del self._windows[key]
+
+    def record(
+        self, guild_id: int, user_id: int, when: float
+    ) -> EscalationRule | None:
+        """
+        Records a warning issued at `when` (epoch seconds) and returns the most
+        severe rule it trips, or None.
+        """
+        if not self.rules:
+            return None
+        windows = self._append((guild_id, user_id), when)
+        self._prune(when)
+
+        triggered = None
+        for rule, window in zip(self.rules, windows):
+            if len(window) == rule.count and when - window[0] <= rule.window:
+                if triggered is None or rule.severity > triggered.severity:
+                    triggered = rule
+        return triggered
+
+    def load(self, rows):
+        """
+        Rebuilds the windows from `(guild_id, user_id, epoch_seconds)` rows
+        ordered by time, without evaluating any rules.
+        """
+        self._windows.clear()
+        if not self.rules:
+            return
+        for guild_id, user_id, when in rows:
+            self._append((guild_id, user_id), when)
+
+    def reset(self, guild_id: int, user_id: int):
+        """Forgets a member's recent warnings, e.g. after they were cleared."""
+        self._windows.pop((guild_id, user_id), None)
@@ -0,0 +1,58 @@
+import mmap
+import tempfile
+from array import array
+
+from .cache import LRUCache
+
+ANSWER_CACHE_SIZE = 128
+
+
+class AnswerStore:
+    """
+    FAQ answers kept on disk instead of in memory.
+
+    The answers are written once, UTF-8 encoded and back to back, into an
+    anonymous temporary file that is memory-mapped. Only one offset per
+    answer stays resident; an answer is decoded from the mapping when asked
+    for, and the most recently used ones are kept in a small LRU cache. The
+    file is deleted by the OS once the store is closed or garbage-collected,
+    so a store replaced by a reload stays readable for as long as anything
+    still holds it.
+    """
+
+    def __init__(self, answers, cache_size: int = ANSWER_CACHE_SIZE):
+        self._offsets = array("Q", [0])
+        self._file = tempfile.TemporaryFile()
+        for answer in answers:
+            written = self._file.write(answer.encode("utf-8"))
+            self._offsets.append(self._offsets[-1] + written)
+        self._file.flush()
+        # An empty file cannot be mapped; there is nothing to read from it anyway.
+        self._map = None
+        if self.nbytes:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._cache = LRUCache(cache_size)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the answers on disk."""
+        return self._offsets[-1]
+
+    def get(self, i: int) -> str:
+        answer = self._cache.get(i)
+        if answer is None:
+            start, end = self._offsets[i], self._offsets[i + 1]
+            answer = self._map[start:end].decode("utf-8") if end > start else ""
+            self._cache.put(i, answer)
+        return answer
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
@@ -1,13 +1,192 @@
-from datetime import datetime
+import glob
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
 
-LOG_FILE = "logs/moderation_actions.log"
+from .database import DB_PATH
+
+LOG_FILE = "logs/moderation_actions.jsonl"
+
+# --- ROTATION SETTINGS ---
+MAX_BYTES = 5 * 1024 * 1024  # rotate once the file would grow past this size
+ROTATE_INTERVAL = 24 * 3600  # ...or once it is this many seconds old
+BACKUP_COUNT = 14  # rotated files to keep; older ones are deleted
+# The longest the kept files can reach back; older `audit_log` rows are pruned with them.
+RETENTION_SECONDS = (BACKUP_COUNT + 1) * ROTATE_INTERVAL
+FLUSH_INTERVAL = 0.5  # seconds the writer waits to gather a batch
+MAX_BATCH = 500  # entries written per batch at most
+
+
+class AuditLogWriter:
+    """
+    Appends audit records from a background thread. Callers only enqueue a record,
+    so logging never blocks the event loop on disk I/O. Records are written in
+    batches as JSON lines, with the file rotated by size and age under bounded
+    retention, and indexed in the `audit_log` table of `db_path` for `/modlog`.
+    The index is pruned to the same retention whenever the file rotates.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: str, db_path: str):
+        self.path = path
+        self.db_path = db_path
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._file = None
+        # When the current file got its first record; 0 until it is known.
+        self._started_at = 0.0
+        self._db = None
+
+    def write(self, entry: dict):
+        """Queues one record for writing; starts the writer thread on first use."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="audit-log-writer", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(entry)
+
+    def close(self, timeout: float = 5.0):
+        """Writes everything still queued, then stops the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(self._STOP)
+        thread.join(timeout)
+
+    # --- Writer thread ---
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            try:
+                batch = [self._queue.get(timeout=FLUSH_INTERVAL)]
+            except queue.Empty:
+                continue
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if self._STOP in batch:
+                stopping = True
+                batch = [entry for entry in batch if entry is not self._STOP]
+            if batch:
+                self._write_batch(batch)
+                self._index_batch(batch)
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._db:
+            self._db.close()
+            self._db = None
+
+    def _write_batch(self, batch: list):
+        data = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in batch)
+        try:
+            self._rotate_if_needed(len(data.encode("utf-8")))
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+                if not self._started_at:
+                    self._started_at = time.time()
+            self._file.write(data)
+            self._file.flush()
+        except OSError as e:
+            print(f"Logger error while writing audit log: {e}")
+
+    def _rotate_if_needed(self, incoming: int):
+        if not os.path.exists(self.path):
+            return
+        size = os.path.getsize(self.path)
+        if size == 0:
+            return
+        if not self._started_at:
+            self._started_at = self._first_record_time()
+        if (
+            size + incoming <= MAX_BYTES
+            and time.time() - self._started_at < ROTATE_INTERVAL
+        ):
+            return
+
+        if self._file:
+            self._file.close()
+            self._file = None
+        suffix = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        target, n = f"{self.path}.{suffix}", 1
+        while os.path.exists(target):
+            target, n = f"{self.path}.{suffix}-{n}", n + 1
+        os.replace(self.path, target)
+        self._started_at = 0.0
+
+        # Timestamped names sort chronologically, so the oldest come first.
+        backups = sorted(glob.glob(glob.escape(self.path) + ".*"))
+        for old in backups[:-BACKUP_COUNT]:
+            os.remove(old)
+        self._prune_index(time.time() - RETENTION_SECONDS)
+
+    def _first_record_time(self) -> float:
+        """
+        The `epoch` of the file's first record, so a file carried over from an
+        earlier run still rotates by its real age. The modification time is only
+        the last append, so it is just the fallback for an unreadable first line.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return float(json.loads(f.readline())["epoch"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return os.path.getmtime(self.path)
+
+    def _connect_db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.db_path)
+            self._db.execute("PRAGMA busy_timeout=5000")
+        return self._db
+
+    def _prune_index(self, before: float):
+        """Deletes `audit_log` rows older than `before` (epoch seconds)."""
+        try:
+            db = self._connect_db()
+            deleted = db.execute(
+                "DELETE FROM audit_log WHERE timestamp < ?", (int(before),)
+            ).rowcount
+            db.commit()
+        except sqlite3.Error as e:
+            print(f"Logger error while pruning audit log index: {e}")
+            return
+        if deleted:
+            print(f"Audit log: Pruned {deleted} index row(s) past retention.")
+
+    def _index_batch(self, batch: list):
+        try:
+            self._connect_db().executemany(
+                "INSERT INTO audit_log (timestamp, moderator_id, action, target, reason) "
+                "VALUES (:epoch, :moderator_id, :action, :target_id, :reason)",
+                batch,
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"Logger error while indexing audit log: {e}")
+
+
+_writer = AuditLogWriter(LOG_FILE, DB_PATH)
 
 
 def log_action(
     moderator: str, action: str, target: str, reason: str = "No reason provided"
 ):
     """
-    Logs a moderation action to the specified log file.
+    Logs a moderation action to the specified log file as a structured record.
+    The record is written and indexed by a background thread, so this never blocks.
 
     Args:
         moderator (str): The ID of the moderator performing the action.
@@ -15,8 +194,22 @@ def log_action(
         target (str): The ID of the user being actioned.
         reason (str): The reason for the action.
     """
-    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-    log_entry = f"[{timestamp}] MODERATOR_ID={moderator} | ACTION={action.upper()} | TARGET_ID={target} | REASON='{reason}'\n"
+    now = datetime.now(timezone.utc)
+    _writer.write(
+        {
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S UTC"),
+            "epoch": int(now.timestamp()),
+            "moderator_id": str(moderator),
+            "action": action.upper(),
+            "target_id": str(target),
+            "reason": reason,
+        }
+    )
 
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(log_entry)
+
+def shutdown():
+    """
+    Flushes pending log entries and stops the writer thread.
+    This function blocks, so call it from a thread when inside the event loop.
+    """
+    _writer.close()
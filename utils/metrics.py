@@ -0,0 +1,173 @@
+import asyncio
+import contextvars
+import time
+from bisect import bisect_left
+
+# --- METRICS REGISTRY ---
+
+# Upper bounds (in seconds) of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# The slash command the current task is handling. Set once per interaction in the
+# tree's interaction check, and read by timers so DB and HTTP time is attributed
+# to the command that caused it.
+current_command = contextvars.ContextVar("current_command", default="none")
+
+
+class Histogram:
+    """A fixed-bucket histogram; recording a value is one bisect and two additions."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile by interpolating inside the bucket that holds it."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else lower
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+class Registry:
+    """Holds every histogram and counter, keyed by metric name and command label."""
+
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+
+    def observe(self, name: str, value: float, command: str = None):
+        key = (name, command or current_command.get())
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(value)
+
+    def inc(self, name: str, amount: float = 1, command: str = None):
+        key = (name, command or current_command.get())
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def render(self) -> str:
+        """Renders all metrics in the Prometheus text exposition format."""
+        lines = []
+        for name in sorted({name for name, _ in self.histograms}):
+            lines.append(f"# TYPE {name} histogram")
+            for (metric, command), h in sorted(self.histograms.items()):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, n in zip(self.buckets_of(h), h.counts):
+                    cumulative += n
+                    lines.append(
+                        f'{name}_bucket{{command="{command}",le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f'{name}_sum{{command="{command}"}} {h.sum}')
+                lines.append(f'{name}_count{{command="{command}"}} {h.count}')
+        for name in sorted({name for name, _ in self.counters}):
+            lines.append(f"# TYPE {name} counter")
+            for (metric, command), value in sorted(self.counters.items()):
+                if metric == name:
+                    lines.append(f'{name}{{command="{command}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def buckets_of(histogram: Histogram) -> list:
+        return [str(b) for b in histogram.buckets] + ["+Inf"]
+
+
+registry = Registry()
+
+
+def observe(name: str, value: float, command: str = None):
+    """Records one value in the named histogram."""
+    registry.observe(name, value, command)
+
+
+def inc(name: str, amount: float = 1, command: str = None):
+    """Increments the named counter."""
+    registry.inc(name, amount, command)
+
+
+class timer:
+    """
+    Context manager that records how long its block took in a histogram.
+    Usage: `with metrics.timer("bot_db_seconds"): ...`
+    """
+
+    __slots__ = ("name", "command", "start")
+
+    def __init__(self, name: str, command: str = None):
+        self.name = name
+        self.command = command
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        registry.observe(self.name, time.perf_counter() - self.start, self.command)
+        return False
+
+
+# --- EVENT LOOP LAG ---
+
+
+async def monitor_event_loop(interval: float = 0.5):
+    """
+    Measures how late the loop wakes up from a sleep of `interval` seconds.
+    Any delay beyond the interval is time the loop spent blocked.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - start - interval)
+        registry.observe("bot_event_loop_lag_seconds", lag, command="none")
+
+
+# --- HTTP EXPORTER ---
+
+
+async def _handle_scrape(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+        # Drain the headers; the exporter answers every path with the same page.
+        while (await asyncio.wait_for(reader.readline(), timeout=5)).strip():
+            pass
+        body = registry.render().encode("utf-8")
+        status = "200 OK" if request_line.startswith(b"GET") else "405 Method Not Allowed"
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode("ascii")
+            + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_exporter(port: int, host: str = "127.0.0.1") -> asyncio.AbstractServer:
+    """Serves the metrics in Prometheus text format on a local port."""
+    server = await asyncio.start_server(_handle_scrape, host, port)
+    print(f"Metrics: Serving on http://{host}:{port}/metrics")
+    return server
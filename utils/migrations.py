@@ -0,0 +1,183 @@
+import sqlite3
+
+# --- SCHEMA MIGRATIONS ---
+
+# Each entry is (version, description, statements). The applied version is
+# tracked in SQLite's `user_version` pragma, so every migration runs exactly once.
+# Append new migrations to the end of this list; never edit one that has shipped.
+MIGRATIONS = [
+    (
+        1,
+        "create the warnings table",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS warnings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                moderator_id INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+        ],
+    ),
+    (
+        2,
+        "index warnings by guild, user and timestamp",
+        [
+            # Serves the per-user filter and the timestamp sort without a table scan,
+            # and covers COUNT(*) / DELETE lookups on (guild_id, user_id) entirely.
+            """
+            CREATE INDEX IF NOT EXISTS idx_warnings_guild_user_ts
+            ON warnings (guild_id, user_id, timestamp)
+            """,
+        ],
+    ),
+    (
+        3,
+        "index warnings by guild, user and id for keyset pagination",
+        [
+            """
+            CREATE INDEX IF NOT EXISTS idx_warnings_guild_user_id
+            ON warnings (guild_id, user_id, id)
+            """,
+        ],
+    ),
+    (
+        4,
+        "maintain per-user warning totals with triggers",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS warning_counts (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, user_id)
+            ) WITHOUT ROWID
+            """,
+            """
+            INSERT OR REPLACE INTO warning_counts (guild_id, user_id, count)
+            SELECT guild_id, user_id, COUNT(*) FROM warnings GROUP BY guild_id, user_id
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_warning_counts_insert
+            AFTER INSERT ON warnings
+            BEGIN
+                INSERT INTO warning_counts (guild_id, user_id, count)
+                VALUES (NEW.guild_id, NEW.user_id, 1)
+                ON CONFLICT (guild_id, user_id) DO UPDATE SET count = count + 1;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_warning_counts_delete
+            AFTER DELETE ON warnings
+            BEGIN
+                UPDATE warning_counts SET count = count - 1
+                WHERE guild_id = OLD.guild_id AND user_id = OLD.user_id;
+                DELETE FROM warning_counts
+                WHERE guild_id = OLD.guild_id AND user_id = OLD.user_id AND count <= 0;
+            END
+            """,
+        ],
+    ),
+    (
+        5,
+        "index warnings by timestamp",
+        [
+            # Lets startup and maintenance jobs read a recent (or old) time range directly.
+            """
+            CREATE INDEX IF NOT EXISTS idx_warnings_timestamp
+            ON warnings (timestamp)
+            """,
+        ],
+    ),
+    (
+        6,
+        "index audit log entries by moderator, target, action and time",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS audit_log (
+                id INTEGER PRIMARY KEY,
+                timestamp INTEGER NOT NULL,
+                moderator_id TEXT NOT NULL,
+                action TEXT NOT NULL,
+                target TEXT NOT NULL,
+                reason TEXT
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp ON audit_log (timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_audit_log_moderator ON audit_log (moderator_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_audit_log_target ON audit_log (target, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_audit_log_action ON audit_log (action, timestamp)",
+        ],
+    ),
+    (
+        7,
+        "create the automod rules table",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS automod_rules (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                pattern TEXT NOT NULL,
+                action TEXT NOT NULL,
+                created_by INTEGER NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_automod_rules_guild ON automod_rules (guild_id)",
+        ],
+    ),
+    (
+        8,
+        "create the scheduled jobs table for expiring punishments",
+        [
+            # One pending job per (kind, guild, user): a new temp ban replaces the old expiry.
+            """
+            CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                due INTEGER NOT NULL,
+                reason TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (kind, guild_id, user_id)
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_due ON scheduled_jobs (due)",
+        ],
+    ),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Returns the schema version currently recorded in the database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(conn: sqlite3.Connection, target: int = LATEST_VERSION) -> int:
+    """
+    Applies every pending migration up to `target`, each in its own transaction.
+    Returns the schema version the database ends up at.
+    """
+    current = get_schema_version(conn)
+    for version, description, statements in MIGRATIONS:
+        if version <= current or version > target:
+            continue
+        try:
+            conn.execute("BEGIN")
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        print(f"Database: Applied migration {version} ({description}).")
+        current = version
+    return current
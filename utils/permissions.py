@@ -0,0 +1,69 @@
+from enum import IntEnum
+
+import discord
+
+from .cache import LRUCache
+from .config import settings
+
+MEMBER_CACHE_SIZE = 10_000
+
+
+class Tier(IntEnum):
+    """Permission tiers; each one includes every tier below it."""
+
+    EVERYONE = 0
+    MODERATOR = 1
+    ADMIN = 2
+
+
+class PermissionResolver:
+    """
+    Resolves which tiers a member holds from the role IDs configured for each
+    tier. A member's tiers are computed once, cached as a set and reused until
+    their roles change, so a permission check is a single set lookup.
+    """
+
+    def __init__(self, roles: dict):
+        self.roles = roles  # {tier: role_ids}
+        self._members = LRUCache(MEMBER_CACHE_SIZE)
+
+    def tiers(self, member: discord.abc.User) -> frozenset:
+        """Returns every tier the member holds (always including EVERYONE)."""
+        if not isinstance(member, discord.Member):
+            return frozenset((Tier.EVERYONE,))
+        key = (member.guild.id, member.id)
+        tiers = self._members.get(key)
+        if tiers is None:
+            highest = Tier.EVERYONE
+            for tier, role_ids in self.roles.items():
+                if tier > highest and any(member.get_role(r) for r in role_ids):
+                    highest = tier
+            tiers = frozenset(t for t in Tier if t <= highest)
+            self._members.put(key, tiers)
+        return tiers
+
+    def has_tier(self, member: discord.abc.User, tier: Tier) -> bool:
+        return tier in self.tiers(member)
+
+    def invalidate(self, guild_id: int, member_id: int):
+        self._members.pop((guild_id, member_id))
+
+    def invalidate_all(self):
+        self._members.clear()
+
+    def stats(self) -> dict:
+        return self._members.stats()
+
+
+def command_tier(command) -> Tier:
+    """Returns the tier a command requires, as recorded by `decorators.require_tier`."""
+    callback = getattr(command, "callback", None)
+    return getattr(callback, "__permission_tier__", Tier.EVERYONE)
+
+
+resolver = PermissionResolver(
+    {
+        Tier.ADMIN: frozenset((settings.ADMIN_ROLE_ID,)),
+        Tier.MODERATOR: frozenset(settings.MODERATOR_ROLE_IDS),
+    }
+)
@@ -0,0 +1,167 @@
+import re
+from collections import Counter, deque
+from typing import NamedTuple
+
+# --- DETECTION SETTINGS ---
+WINDOW_SECONDS = 10  # length of the sliding join-rate window
+NEW_ACCOUNT_AGE = 7 * 86400  # accounts younger than this count as "new"
+NEW_ACCOUNT_THRESHOLD = 5  # new accounts per window that trigger a lockdown
+SIMILAR_NAME_THRESHOLD = 4  # joins sharing a name skeleton that trigger a lockdown
+RECENT_NAMES = 100  # at most this many recent joins are compared for similar names
+RECENT_NAME_AGE = 60  # ...and only those from the last this many seconds
+
+_NAME_NOISE = re.compile(r"[\W\d_]+")
+
+
+def name_skeleton(name: str) -> str:
+    """
+    Reduces a username to its letters, so 'raider_01', 'Raider-22' and
+    'r.a.i.d.e.r' all map to 'raider'.
+    """
+    return _NAME_NOISE.sub("", name.casefold())
+
+
+class SlidingWindowCounter:
+    """
+    Counts events over the last `window` seconds using one bucket per second
+    in a fixed ring, so both adding and counting take constant time and memory.
+    """
+
+    __slots__ = ("window", "buckets", "slots", "total", "last")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.buckets = [0] * window
+        self.slots = [-1] * window
+        self.total = 0
+        self.last = -1
+
+    def _expire(self, slot: int):
+        # Within the same second nothing can have expired.
+        if slot == self.last:
+            return
+        self.last = slot
+        for i in range(self.window):
+            if self.slots[i] != -1 and slot - self.slots[i] >= self.window:
+                self.total -= self.buckets[i]
+                self.buckets[i] = 0
+                self.slots[i] = -1
+
+    def add(self, now: float, amount: int = 1) -> int:
+        """Records `amount` events at `now` and returns the count inside the window."""
+        slot = int(now)
+        self._expire(slot)
+        i = slot % self.window
+        if self.slots[i] != slot:
+            self.slots[i] = slot
+        self.buckets[i] += amount
+        self.total += amount
+        return self.total
+
+    def count(self, now: float) -> int:
+        self._expire(int(now))
+        return self.total
+
+
+class JoinVerdict(NamedTuple):
+    lockdown_started: bool
+    in_lockdown: bool
+    reasons: tuple
+
+
+class GuildJoinState:
+    """Per-guild counters; their size is fixed no matter how fast members join."""
+
+    __slots__ = ("joins", "new_accounts", "recent_names", "name_counts", "lockdown_until")
+
+    def __init__(self):
+        self.joins = SlidingWindowCounter(WINDOW_SECONDS)
+        self.new_accounts = SlidingWindowCounter(WINDOW_SECONDS)
+        self.recent_names = deque()
+        self.name_counts = Counter()
+        self.lockdown_until = 0.0
+
+    def remember_name(self, skeleton: str, now: float) -> int:
+        """Adds a name to the recent-joins ring and returns how often it occurs there."""
+        names = self.recent_names
+        while names and (
+            len(names) >= RECENT_NAMES or now - names[0][0] > RECENT_NAME_AGE
+        ):
+            _, oldest = names.popleft()
+            self.name_counts[oldest] -= 1
+            if not self.name_counts[oldest]:
+                del self.name_counts[oldest]
+        names.append((now, skeleton))
+        self.name_counts[skeleton] += 1
+        return self.name_counts[skeleton]
+
+
+class RaidDetector:
+    """
+    Looks at every member join in O(1) and decides whether the guild is being
+    raided: too many joins in the window, too many brand-new accounts, or a
+    cluster of near-identical names. A detected raid opens a lockdown that lasts
+    `lockdown_seconds` and is extended while suspicious joins keep arriving.
+    """
+
+    def __init__(self, join_threshold: int, lockdown_seconds: int):
+        self.join_threshold = join_threshold
+        self.lockdown_seconds = lockdown_seconds
+        self._guilds = {}
+
+    def state(self, guild_id: int) -> GuildJoinState:
+        state = self._guilds.get(guild_id)
+        if state is None:
+            state = self._guilds[guild_id] = GuildJoinState()
+        return state
+
+    def in_lockdown(self, guild_id: int, now: float) -> bool:
+        state = self._guilds.get(guild_id)
+        return state is not None and state.lockdown_until > now
+
+    def lockdown_until(self, guild_id: int) -> float:
+        """When the guild's lockdown ends (epoch seconds); 0 if it was never locked down."""
+        state = self._guilds.get(guild_id)
+        return state.lockdown_until if state is not None else 0.0
+
+    def start_lockdown(self, guild_id: int, now: float, until: float | None = None):
+        """Locks the guild down for `lockdown_seconds`, or until `until` if given."""
+        self.state(guild_id).lockdown_until = (
+            until if until is not None else now + self.lockdown_seconds
+        )
+
+    def end_lockdown(self, guild_id: int):
+        state = self._guilds.get(guild_id)
+        if state is not None:
+            state.lockdown_until = 0.0
+
+    def process_join(
+        self, guild_id: int, name: str, created_at: float, now: float
+    ) -> JoinVerdict:
+        """Records one join (times in epoch seconds) and returns what to do about it."""
+        state = self.state(guild_id)
+        reasons = []
+
+        joins = state.joins.add(now)
+        if joins >= self.join_threshold:
+            reasons.append(f"{joins} joins in {WINDOW_SECONDS}s")
+
+        if now - created_at < NEW_ACCOUNT_AGE:
+            fresh = state.new_accounts.add(now)
+            if fresh >= NEW_ACCOUNT_THRESHOLD:
+                reasons.append(f"{fresh} new accounts in {WINDOW_SECONDS}s")
+
+        skeleton = name_skeleton(name)
+        if skeleton:
+            similar = state.remember_name(skeleton, now)
+            if similar >= SIMILAR_NAME_THRESHOLD:
+                reasons.append(f"{similar} recent joins named like '{skeleton}'")
+
+        was_locked = state.lockdown_until > now
+        if reasons:
+            state.lockdown_until = now + self.lockdown_seconds
+        return JoinVerdict(
+            lockdown_started=bool(reasons) and not was_locked,
+            in_lockdown=state.lockdown_until > now,
+            reasons=tuple(reasons),
+        )
@@ -1,5 +1,17 @@
+import time
+
 import discord
 
+from . import metrics
+
+
+async def defer(interaction: discord.Interaction, ephemeral: bool = True):
+    """Defers the response and records how long the bot took to acknowledge it."""
+    await interaction.response.defer(ephemeral=ephemeral)
+    started = interaction.extras.get("started")
+    if started is not None:
+        metrics.observe("bot_defer_seconds", time.perf_counter() - started)
+
 
 async def send_ephemeral_followup(
     interaction: discord.Interaction,
@@ -0,0 +1,114 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+
+
+class HeapScheduler:
+    """
+    Runs any number of delayed jobs from a single task and a single timer.
+
+    Jobs live on a min-heap ordered by due time; the task sleeps until the
+    earliest one is due (or until an earlier job is scheduled), then hands every
+    job that is due to `handler` as one batch. Cancelled jobs are dropped lazily
+    when they reach the top of the heap.
+    """
+
+    def __init__(self, handler, name: str, max_batch: int = 100):
+        self.handler = handler
+        self.name = name
+        self.max_batch = max_batch
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        """True if a job with `key` is still waiting to run."""
+        return key in self._entries
+
+    def schedule(self, when: float, payload, key=None):
+        """
+        Runs `payload` through the handler at `when` (epoch seconds). Scheduling
+        again with the same `key` replaces the earlier job.
+        """
+        if key is None:
+            key = next(self._counter)
+        self.cancel(key)
+        entry = [when, next(self._counter), key, payload]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wakeup.set()
+        self.start()
+        return key
+
+    def cancel(self, key) -> bool:
+        """Cancels a pending job. Returns False if there was none."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[3] = _CANCELLED
+        return True
+
+    def start(self):
+        if self._task is None or self._task.done():
+            # A fresh context, so jobs are not billed to the command that happened
+            # to start the task (via `metrics.current_command`).
+            self._task = asyncio.create_task(
+                self._run(), name=f"{self.name}-scheduler", context=contextvars.Context()
+            )
+
+    async def close(self):
+        """Stops the scheduler. Jobs that have not run yet are discarded."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._heap.clear()
+        self._entries.clear()
+
+    def _pop_due(self, now: float) -> list:
+        batch = []
+        while self._heap and len(batch) < self.max_batch:
+            when, _, key, payload = self._heap[0]
+            if payload is _CANCELLED:
+                heapq.heappop(self._heap)
+                continue
+            if when > now:
+                break
+            heapq.heappop(self._heap)
+            del self._entries[key]
+            batch.append(payload)
+        return batch
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            batch = self._pop_due(time.time())
+            if batch:
+                try:
+                    await self.handler(batch)
+                except Exception as e:
+                    print(f"Error in {self.name} scheduler: {e}")
+                continue
+
+            # Skip cancelled entries so the next timeout is based on a live job.
+            while self._heap and self._heap[0][3] is _CANCELLED:
+                heapq.heappop(self._heap)
+            timeout = self._heap[0][0] - time.time() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+_CANCELLED = object()
@@ -0,0 +1,272 @@
+import heapq
+import math
+import mmap
+import re
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+# --- SEARCH SETTINGS ---
+MAX_RESULTS = 25  # Discord shows at most 25 autocomplete choices
+MAX_CORRECTIONS = 3  # spellings tried for a word that matches nothing
+MIN_SIMILARITY = 0.4  # trigram similarity a correction needs to be considered
+SCAN_LIMIT = 512  # range entries walked before falling back to intersecting ranges
+INTERSECT_RATIO = 8  # longer ranges than this many times the candidates are not intersected
+
+# --- FULL-TEXT SETTINGS ---
+MAX_SEARCH_RESULTS = 50
+QUESTION_WEIGHT = 3  # a question word counts as this many answer words
+BM25_K1 = 1.2
+BM25_B = 0.75
+CHAMPION_LIMIT = 2_000  # postings read per term; only very common terms have more
+
+_NON_WORD = re.compile(r"[\W_]+")
+_PREFIX_END = "\U0010ffff"
+_WORD_END = "\x00"
+
+
+def normalize(text: str) -> str:
+    """Folds case and turns punctuation into single spaces."""
+    return _NON_WORD.sub(" ", text.casefold()).strip()
+
+
+def trigrams(word: str) -> set:
+    """Returns a word's trigrams, padded so short words still have some."""
+    padded = f" {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class FaqIndex:
+    """
+    An autocomplete index over FAQ questions.
+
+    Questions are found by a prefix of the whole question first, then by every
+    typed word matching a word of the question (the last one as a prefix, since
+    it is still being typed). Both come from sorted lists searched with bisect.
+    A word that matches nothing is treated as a typo: the closest vocabulary
+    words by shared trigrams are tried in its place. No lookup scans every
+    question.
+    """
+
+    def __init__(self, questions: list):
+        self.questions = questions
+        normalized = [normalize(question) for question in questions]
+        self._lengths = array("I", map(len, normalized))
+
+        # Space-padded, so " word " and " prefix" are plain substring checks, and
+        # so a whole-question prefix is a bisect on " prefix".
+        self._padded = [f" {text} " for text in normalized]
+        order = sorted(range(len(questions)), key=lambda i: (self._padded[i], i))
+        self._sorted_questions = [self._padded[i] for i in order]
+        self._sorted_question_ids = array("I", order)
+
+        # Words sort before longer words sharing their prefix, and shorter questions first.
+        entries = sorted(
+            (word, len(text), i)
+            for i, text in enumerate(normalized)
+            # Interned, so each distinct word is stored once however many questions use it.
+            for word in set(map(sys.intern, text.split()))
+        )
+        self._words = [word for word, _, _ in entries]
+        self._word_ids = array("I", (i for _, _, i in entries))
+
+        self._vocabulary = sorted(set(self._words))
+        postings = {}
+        for v, word in enumerate(self._vocabulary):
+            for gram in trigrams(word):
+                postings.setdefault(gram, array("I")).append(v)
+        self._trigrams = postings
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def _range(self, word: str, prefix: bool) -> tuple:
+        end = _PREFIX_END if prefix else _WORD_END
+        return bisect_left(self._words, word), bisect_left(self._words, word + end)
+
+    def find(self, question: str) -> int | None:
+        """Returns the index of the question equal to `question`, ignoring case and punctuation."""
+        key = f" {normalize(question)} "
+        position = bisect_left(self._sorted_questions, key)
+        if position < len(self._sorted_questions) and self._sorted_questions[position] == key:
+            return self._sorted_question_ids[position]
+        return None
+
+    def corrections(self, word: str, limit: int = MAX_CORRECTIONS) -> list:
+        """Returns up to `limit` vocabulary words that look most like `word`."""
+        grams = trigrams(word)
+        counts = Counter()
+        for gram in grams:
+            posting = self._trigrams.get(gram)
+            if posting is not None:
+                counts.update(posting)
+        scored = []
+        for v, shared in counts.items():
+            candidate = self._vocabulary[v]
+            similarity = shared / (len(grams) + len(candidate) - shared)
+            if similarity >= MIN_SIMILARITY:
+                scored.append((-similarity, abs(len(candidate) - len(word)), candidate))
+        scored.sort()
+        return [candidate for _, _, candidate in scored[:limit]]
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> list:
+        """Returns the indices of up to `limit` questions matching `query`, best first."""
+        text = normalize(query)
+        if not text:
+            return list(range(min(limit, len(self.questions))))
+
+        results, seen = [], set()
+        start = bisect_left(self._sorted_questions, f" {text}")
+        end = bisect_left(self._sorted_questions, f" {text}{_PREFIX_END}")
+        for position in range(start, min(end, start + limit)):
+            i = self._sorted_question_ids[position]
+            seen.add(i)
+            results.append(i)
+        if len(results) >= limit:
+            return results
+
+        # (word, is_prefix) pairs; the last word is a prefix unless a space follows it.
+        terms = [(word, False) for word in text.split()]
+        if not query[-1:].isspace():
+            terms[-1] = (terms[-1][0], True)
+        ranges = [self._range(word, prefix) for word, prefix in terms]
+        missing = [n for n, (start, end) in enumerate(ranges) if start == end]
+        if not missing:
+            self._collect(terms, ranges, limit, seen, results)
+        elif len(missing) == 1:
+            # Treat the one unknown word as a typo and try its closest spellings.
+            n = missing[0]
+            word, prefix = terms[n]
+            for correction in self.corrections(word):
+                terms[n] = (correction, prefix)
+                ranges[n] = self._range(correction, prefix)
+                self._collect(terms, ranges, limit, seen, results)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def _collect(self, terms: list, ranges: list, limit: int, seen: set, results: list):
+        """Walks the narrowest word range and checks the other terms per question."""
+        order = sorted(range(len(terms)), key=lambda n: ranges[n][1] - ranges[n][0])
+        word_ids = self._word_ids
+        start, end = ranges[order[0]]
+        scan_end = min(end, start + SCAN_LIMIT)
+        if self._check(word_ids[start:scan_end], terms, order[1:], limit, seen, results):
+            return
+        if scan_end == end:
+            return
+        # Only rare combinations get here: intersect the rest of the range with the
+        # other terms' questions instead of walking it. Ranges much longer than the
+        # candidates left are cheaper to check per candidate afterwards.
+        candidates = set(word_ids[scan_end:end])
+        unchecked = []
+        for n in order[1:]:
+            other_start, other_end = ranges[n]
+            if other_end - other_start > INTERSECT_RATIO * len(candidates):
+                unchecked.append(n)
+            else:
+                candidates.intersection_update(word_ids[other_start:other_end])
+        candidates.difference_update(seen)
+        ranked = sorted(candidates)
+        ranked.sort(key=self._lengths.__getitem__)
+        self._check(ranked, terms, unchecked, limit, seen, results)
+
+    def _check(self, candidates, terms, others, limit, seen, results) -> bool:
+        """Adds the candidates that match every other term; True once `limit` is reached."""
+        needles = []
+        for n in others:
+            word, prefix = terms[n]
+            needles.append(f" {word}" if prefix else f" {word} ")
+        padded = self._padded
+        for i in candidates:
+            if i in seen:
+                continue
+            text = padded[i]
+            for needle in needles:
+                if needle not in text:
+                    break
+            else:
+                seen.add(i)
+                results.append(i)
+                if len(results) >= limit:
+                    return True
+        return False
+
+
+class FullTextIndex:
+    """
+    A BM25 index over whole FAQ entries, questions and answers together.
+
+    Each term maps to its postings: the entries containing it with their
+    precomputed BM25 score for that term, highest first. A query adds up the
+    postings of its terms, so its cost depends on how common those terms are,
+    not on how many entries there are. Terms common enough to appear in more
+    than CHAMPION_LIMIT entries only contribute their best-scoring postings
+    (a "champion list"), which keeps frequent words from dominating the
+    latency while barely changing the top results.
+
+    The postings are written to a memory-mapped temporary file, like the
+    answers in `faq_store.AnswerStore`; only the vocabulary stays in memory.
+    """
+
+    def __init__(self, entries: list):
+        """`entries` is a list of (question, answer) pairs."""
+        # Term frequencies per term, in compact arrays rather than per-entry dicts.
+        postings = {}
+        lengths = array("I")
+        for i, (question, answer) in enumerate(entries):
+            # Question words are weighted higher, as if they appeared several times.
+            counts = Counter(normalize(answer).split())
+            for word in normalize(question).split():
+                counts[word] += QUESTION_WEIGHT
+            for word, tf in counts.items():
+                posting = postings.get(word)
+                if posting is None:
+                    posting = postings[word] = (array("I"), array("I"))
+                posting[0].append(i)
+                posting[1].append(tf)
+            lengths.append(sum(counts.values()))
+
+        self._size = len(lengths)
+        average = sum(lengths) / len(lengths) if lengths else 0.0
+        norms = [BM25_K1 * (1 - BM25_B + BM25_B * length / average) for length in lengths]
+
+        # Each term's entry ids followed by their scores, best first, as 4-byte values.
+        self._file = tempfile.TemporaryFile()
+        self._postings = {}
+        offset = 0
+        for word, (ids, tfs) in postings.items():
+            idf = math.log(1 + (self._size - len(ids) + 0.5) / (len(ids) + 0.5))
+            scores = [
+                idf * tf * (BM25_K1 + 1) / (tf + norms[i]) for i, tf in zip(ids, tfs)
+            ]
+            order = sorted(range(len(ids)), key=lambda n: (-scores[n], ids[n]))
+            array("I", [ids[n] for n in order]).tofile(self._file)
+            array("f", [scores[n] for n in order]).tofile(self._file)
+            self._postings[sys.intern(word)] = (offset, len(ids))
+            offset += 8 * len(ids)
+        self._file.flush()
+        self._view = None
+        if offset:
+            mapping = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(mapping)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def search(self, query: str, limit: int = MAX_SEARCH_RESULTS) -> list:
+        """Returns `(entry_index, score)` pairs for the best `limit` matches, best first."""
+        scores = {}
+        for word in set(normalize(query).split()):
+            posting = self._postings.get(word)
+            if posting is None:
+                continue
+            offset, count = posting
+            read = 4 * min(count, CHAMPION_LIMIT)
+            ids = self._view[offset : offset + read].cast("I")
+            impacts = self._view[offset + 4 * count : offset + 4 * count + read].cast("f")
+            for i, impact in zip(ids, impacts):
+                scores[i] = scores.get(i, 0.0) + impact
+        return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
@@ -0,0 +1,116 @@
+import asyncio
+import contextvars
+
+import discord
+
+# --- SEND QUEUE SETTINGS ---
+COALESCE_WINDOW = 0.2  # seconds to wait for more embeds before sending
+MAX_EMBEDS = 10  # Discord allows at most 10 embeds per message
+MAX_EMBED_CHARS = 6000  # ...and 6000 characters across all of them
+MAX_QUEUE_SIZE = 100  # senders wait once this many embeds are pending
+IDLE_TIMEOUT = 60  # seconds before an idle channel's worker exits
+
+
+class ChannelSendQueue:
+    """
+    Sends the embeds queued for one channel, merging those that arrive within
+    a short window into a single message. The bounded queue applies
+    backpressure: when it is full, `put` waits until the worker catches up.
+    """
+
+    def __init__(self, channel: discord.abc.Messageable):
+        self.channel = channel
+        self._queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+        self._carry = None
+        # A fresh context, so the worker does not inherit `metrics.current_command`
+        # from whichever command first used this channel and bill later sends to it.
+        self.task = asyncio.create_task(
+            self._run(), name=f"send-queue-{channel.id}", context=contextvars.Context()
+        )
+
+    async def put(self, embed: discord.Embed) -> asyncio.Future:
+        """Queues an embed; the returned future resolves to the message it was sent in."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((embed, future))
+        return future
+
+    async def _next_batch(self) -> list | None:
+        if self._carry is not None:
+            first, self._carry = self._carry, None
+        else:
+            try:
+                first = await asyncio.wait_for(self._queue.get(), IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                return None
+
+        loop = asyncio.get_running_loop()
+        batch, chars = [first], len(first[0])
+        deadline = loop.time() + COALESCE_WINDOW
+        while len(batch) < MAX_EMBEDS:
+            remaining = deadline - loop.time()
+            try:
+                if self._queue.empty() and remaining > 0:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                else:
+                    item = self._queue.get_nowait()
+            except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                break
+            if chars + len(item[0]) > MAX_EMBED_CHARS:
+                self._carry = item
+                break
+            batch.append(item)
+            chars += len(item[0])
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            if batch is None:
+                # Nothing arrived for a while; release this channel's worker.
+                if self._queue.empty() and self._carry is None:
+                    _queues.pop(self.channel.id, None)
+                    return
+                continue
+
+            try:
+                message = await self.channel.send(embeds=[embed for embed, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(message)
+
+    def cancel(self):
+        self.task.cancel()
+        pending = [self._carry] if self._carry else []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future in pending:
+            future.cancel()
+
+
+_queues = {}
+
+
+async def send_embed(
+    channel: discord.abc.Messageable, embed: discord.Embed
+) -> discord.Message:
+    """
+    Sends an embed to a channel through its coalescing queue and returns the
+    message it ended up in. Raises the same errors as `channel.send`.
+    """
+    queue = _queues.get(channel.id)
+    if queue is None:
+        queue = _queues[channel.id] = ChannelSendQueue(channel)
+    future = await queue.put(embed)
+    return await future
+
+
+def shutdown():
+    """Stops every channel worker and cancels embeds that were never sent."""
+    for queue in list(_queues.values()):
+        queue.cancel()
+    _queues.clear()
@@ -0,0 +1,113 @@
+import re
+from typing import NamedTuple
+
+from .cache import LRUCache
+
+# --- SPAM SETTINGS ---
+HISTORY_SIZE = 8  # messages remembered per member; must cover both thresholds below
+DUPLICATE_THRESHOLD = 3  # identical messages that count as copy-paste spam...
+DUPLICATE_WINDOW = 60  # ...when sent within this many seconds
+FLOOD_THRESHOLD = 6  # messages of any kind that count as flooding...
+FLOOD_WINDOW = 5  # ...when sent within this many seconds
+MAX_TRACKED_MEMBERS = 20_000  # idle members beyond this are forgotten, oldest first
+
+_NOISE = re.compile(r"[\W_]+")
+
+
+def content_hash(content: str) -> int:
+    """
+    Hashes message content after folding case, punctuation and spacing, so
+    trivial edits like 'BUY NOW!!' vs 'buy now' still count as duplicates.
+    Returns 0 for content with nothing left to compare.
+    """
+    normalized = _NOISE.sub(" ", content.casefold()).strip()
+    return (hash(normalized) or 1) if normalized else 0
+
+
+class SpamVerdict(NamedTuple):
+    kind: str  # "duplicate" or "flood"
+    count: int
+    window: int
+    messages: tuple  # (channel_id, message_id) of every message involved
+
+    def describe(self) -> str:
+        noun = "identical messages" if self.kind == "duplicate" else "messages"
+        return f"{self.count} {noun} in {self.window}s"
+
+
+class MessageHistory:
+    """The last `HISTORY_SIZE` messages of one member, in fixed-size parallel rings."""
+
+    __slots__ = ("times", "hashes", "channels", "messages", "next")
+
+    def __init__(self):
+        self.times = [float("-inf")] * HISTORY_SIZE
+        self.hashes = [0] * HISTORY_SIZE
+        self.channels = [0] * HISTORY_SIZE
+        self.messages = [0] * HISTORY_SIZE
+        self.next = 0
+
+    def add(self, now: float, digest: int, channel_id: int, message_id: int):
+        i = self.next
+        self.times[i] = now
+        self.hashes[i] = digest
+        self.channels[i] = channel_id
+        self.messages[i] = message_id
+        self.next = (i + 1) % HISTORY_SIZE
+
+    def matching(self, now: float, window: int, digest: int | None = None) -> list:
+        """Returns the (channel_id, message_id) of recent messages, optionally only those with `digest`."""
+        cutoff = now - window
+        return [
+            (self.channels[i], self.messages[i])
+            for i in range(HISTORY_SIZE)
+            if self.times[i] >= cutoff and (digest is None or self.hashes[i] == digest)
+        ]
+
+
+class SpamDetector:
+    """
+    Flags members who repeat the same message or post too fast. Each tracked
+    member costs one fixed-size history, and only the `max_members` most
+    recently active are kept, so memory is capped however many members talk.
+    """
+
+    def __init__(self, max_members: int = MAX_TRACKED_MEMBERS):
+        self._histories = LRUCache(max_members)
+
+    def __len__(self) -> int:
+        return len(self._histories)
+
+    def record(
+        self,
+        guild_id: int,
+        user_id: int,
+        channel_id: int,
+        message_id: int,
+        content: str,
+        now: float,
+    ) -> SpamVerdict | None:
+        """Records one message (time in epoch seconds) and returns a verdict if it is spam."""
+        key = (guild_id, user_id)
+        history = self._histories.get(key)
+        if history is None:
+            history = MessageHistory()
+            self._histories.put(key, history)
+
+        digest = content_hash(content)
+        history.add(now, digest, channel_id, message_id)
+
+        if digest:
+            duplicates = history.matching(now, DUPLICATE_WINDOW, digest)
+            if len(duplicates) >= DUPLICATE_THRESHOLD:
+                return SpamVerdict(
+                    "duplicate", len(duplicates), DUPLICATE_WINDOW, tuple(duplicates)
+                )
+        recent = history.matching(now, FLOOD_WINDOW)
+        if len(recent) >= FLOOD_THRESHOLD:
+            return SpamVerdict("flood", len(recent), FLOOD_WINDOW, tuple(recent))
+        return None
+
+    def reset(self, guild_id: int, user_id: int):
+        """Forgets a member's history, e.g. once their spam has been dealt with."""
+        self._histories.pop((guild_id, user_id))
@@ -0,0 +1,192 @@
+import argparse
+import csv
+import gzip
+import json
+import sqlite3
+
+# Export and import of the warnings table. Everything here streams rows in
+# chunks, so moving millions of warnings runs in constant memory. The functions
+# open their own connection and are meant to run off the event loop
+# (e.g. through `asyncio.to_thread`); WAL mode lets them share the file with the bot.
+
+FIELDS = ("id", "guild_id", "user_id", "moderator_id", "reason", "timestamp")
+FORMATS = ("jsonl", "csv")
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+def _open(path: str, mode: str):
+    """Opens a text file, transparently (de)compressing `.gz` paths."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def detect_format(path: str) -> str:
+    """Returns 'jsonl' or 'csv' based on the file name."""
+    name = path[:-3] if path.endswith(".gz") else path
+    for fmt in FORMATS:
+        if name.endswith("." + fmt):
+            return fmt
+    raise ValueError("Unsupported file type. Use .jsonl or .csv (optionally .gz).")
+
+
+# --- EXPORT ---
+
+
+def iter_warnings(conn: sqlite3.Connection, guild_id: int = None, chunk_size: int = 1000):
+    """Yields warning rows as tuples in `id` order, fetching `chunk_size` at a time."""
+    last_id = 0
+    where = "id > ?" + (" AND guild_id = ?" if guild_id is not None else "")
+    while True:
+        params = (last_id, guild_id) if guild_id is not None else (last_id,)
+        rows = conn.execute(
+            f"SELECT {', '.join(FIELDS)} FROM warnings WHERE {where} ORDER BY id LIMIT ?",
+            params + (chunk_size,),
+        ).fetchall()
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1][0]
+
+
+def write_jsonl(rows, fp) -> int:
+    count = 0
+    for row in rows:
+        fp.write(json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def write_csv(rows, fp) -> int:
+    writer = csv.writer(fp)
+    writer.writerow(FIELDS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def export_warnings(db_path: str, out_path: str, guild_id: int = None) -> int:
+    """Streams warnings into `out_path`. Returns the number of rows written."""
+    writer = write_jsonl if detect_format(out_path) == "jsonl" else write_csv
+    conn = _connect(db_path)
+    try:
+        with _open(out_path, "w") as fp:
+            return writer(iter_warnings(conn, guild_id), fp)
+    finally:
+        conn.close()
+
+
+# --- IMPORT ---
+
+
+def read_jsonl(fp):
+    """Yields the non-blank lines; each is decoded by `import_warnings`, so one bad line is only skipped."""
+    for line in fp:
+        if line.strip():
+            yield line
+
+
+def read_csv(fp):
+    yield from csv.DictReader(fp)
+
+
+def _to_row(record: dict) -> tuple:
+    return (
+        int(record["guild_id"]),
+        int(record["user_id"]),
+        int(record["moderator_id"]),
+        str(record["reason"]),
+        str(record["timestamp"]),
+    )
+
+
+# A warning is a duplicate if one with the same guild, user, time, moderator and
+# reason already exists; the (guild_id, user_id, timestamp) index serves the check.
+_INSERT_UNLESS_DUPLICATE = """
+    INSERT INTO warnings (guild_id, user_id, moderator_id, reason, timestamp)
+    SELECT :guild_id, :user_id, :moderator_id, :reason, :timestamp
+    WHERE NOT EXISTS (
+        SELECT 1 FROM warnings
+        WHERE guild_id = :guild_id AND user_id = :user_id AND timestamp = :timestamp
+          AND moderator_id = :moderator_id AND reason = :reason
+    )
+"""
+
+
+def _insert_batch(conn: sqlite3.Connection, batch: list) -> int:
+    cursor = conn.executemany(
+        _INSERT_UNLESS_DUPLICATE,
+        [dict(zip(FIELDS[1:], row)) for row in batch],
+    )
+    conn.commit()
+    return cursor.rowcount
+
+
+def import_warnings(
+    db_path: str, in_path: str, guild_id: int = None, batch_size: int = 1000
+) -> tuple[int, int]:
+    """
+    Streams warnings from `in_path` into the database in `executemany` batches,
+    one transaction each. Rows that already exist, are malformed or (when
+    `guild_id` is given) belong to another guild are skipped.
+    Returns `(imported, skipped)`.
+    """
+    if detect_format(in_path) == "jsonl":
+        reader, decode = read_jsonl, json.loads
+    else:
+        reader, decode = read_csv, dict
+    imported = seen = 0
+    batch = []
+    conn = _connect(db_path)
+    try:
+        with _open(in_path, "r") as fp:
+            for record in reader(fp):
+                seen += 1
+                try:
+                    # json.JSONDecodeError is a ValueError.
+                    row = _to_row(decode(record))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if guild_id is not None and row[0] != guild_id:
+                    continue
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    imported += _insert_batch(conn, batch)
+                    batch.clear()
+            if batch:
+                imported += _insert_batch(conn, batch)
+    finally:
+        conn.close()
+    return imported, seen - imported
+
+
+# --- COMMAND LINE ---
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export or import moderation warnings as JSONL or CSV."
+    )
+    parser.add_argument("action", choices=("export", "import"))
+    parser.add_argument("path", help="File to write or read (.jsonl/.csv, optionally .gz).")
+    parser.add_argument("--db", default="moderation.db", help="Database file.")
+    parser.add_argument("--guild", type=int, help="Only export/import this guild's warnings.")
+    args = parser.parse_args()
+
+    if args.action == "export":
+        count = export_warnings(args.db, args.path, args.guild)
+        print(f"Exported {count} warning(s) to {args.path}.")
+    else:
+        imported, skipped = import_warnings(args.db, args.path, args.guild)
+        print(f"Imported {imported} warning(s), skipped {skipped}.")
+
+
+if __name__ == "__main__":
+    main()